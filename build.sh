@@ -115,7 +115,7 @@ count_lines() {
     
     echo ""
     echo "Python Files:"
-    for file in wine_gui.py wine_gui_main.py wine_gui_window.py; do
+    for file in wine_config.py wine_gui.py wine_gui_main.py wine_gui_window.py; do
         if [ -f "$file" ]; then
             lines=$(wc -l < "$file")
             total=$((total + lines))
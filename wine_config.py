@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Wine Application Manager - Configuration
+Wine settings and application shortcuts, usable without importing Qt
+"""
+
+import os
+import re
+from typing import List, Dict, Optional, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PyQt6.QtCore import QProcessEnvironment
+
+
+# Resolved once; Path.home() does a pwd lookup on every call
+_HOME = os.path.expanduser('~')
+_DEFAULT_CONFIG_DIR = os.path.join(_HOME, '.config', 'wineapp')
+
+DEFAULT_CONFIG = {
+    'wine_prefix': os.path.join(_HOME, '.wine'),
+    'wine_binary': 'wine',
+    'architecture': 'auto',
+    'enable_virtual_desktop': False,
+    'virtual_desktop_resolution': '1024x768',
+    'enable_csmt': True,
+    'enable_dxvk': False,
+    'enable_esync': True,
+    'enable_fsync': False,
+    'audio_driver': 'alsa',
+    'graphics_driver': 'x11',
+    'nice_level': 0,
+    'debug_output': False,
+    'capture_stdout': True,
+    'capture_stderr': True
+}
+
+# wine.conf/shortcuts.conf are flat "key = value" sections, so a pair of
+# regexes is enough and far cheaper than configparser. Like configparser,
+# "key: value" is accepted too and the first '=' or ':' splits the line.
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(r'^\s*([^=:\s][^=:]*?)\s*[=:]\s*(.*?)\s*$')
+_TRUE_VALUES = frozenset(('true', 'yes', '1'))
+
+
+def _parse_bool(value: str) -> bool:
+    return value.lower() in _TRUE_VALUES
+
+
+# Converters for non-string wine.conf keys; everything else stays str
+_COERCE = {
+    'enable_virtual_desktop': _parse_bool,
+    'enable_csmt': _parse_bool,
+    'enable_dxvk': _parse_bool,
+    'enable_esync': _parse_bool,
+    'enable_fsync': _parse_bool,
+    'debug_output': _parse_bool,
+    'capture_stdout': _parse_bool,
+    'capture_stderr': _parse_bool,
+    'nice_level': int,
+}
+
+
+def _read_ini_items(path: str, section: str) -> List[tuple]:
+    """Return the raw (key, value) pairs of one ini section
+    
+    Keys are lowercased, as configparser's optionxform did, so existing
+    files and wine-cli see the same names.
+    """
+    with open(path) as f:
+        text = f.read()
+    
+    items = []
+    current = None
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip()[0] in '#;':
+            continue
+        
+        match = _SECTION_RE.match(line)
+        if match:
+            current = match.group(1)
+            continue
+        
+        if current == section:
+            match = _KV_RE.match(line)
+            if match:
+                key, value = match.groups()
+                items.append((key.lower(), value))
+        elif current is None and _KV_RE.match(line):
+            raise ValueError(f"{path}: key before section header")
+    
+    return items
+
+
+def _write_ini(path: str, section: str, values: Dict[str, Any]):
+    """Write a single ini section in one write() call"""
+    body = ''.join(f'{key} = {value}\n' for key, value in values.items())
+    with open(path, 'w') as f:
+        f.write(f'[{section}]\n{body}\n')
+
+
+class WineConfig:
+    """Wine configuration management
+    
+    One instance is kept per config directory, so dialogs and tabs that
+    construct a WineConfig share the already loaded state.
+    """
+    
+    _instances: Dict[str, 'WineConfig'] = {}
+    _dirs_checked: set = set()
+    
+    def __new__(cls, config_dir: str = None):
+        config_dir = config_dir or _DEFAULT_CONFIG_DIR
+        instance = cls._instances.get(config_dir)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[config_dir] = instance
+        return instance
+    
+    def __init__(self, config_dir: str = None):
+        if getattr(self, '_initialized', False):
+            return
+        self._initialized = True
+        
+        self.config_dir = config_dir or _DEFAULT_CONFIG_DIR
+        
+        self.config_file = os.path.join(self.config_dir, 'wine.conf')
+        self.shortcuts_file = os.path.join(self.config_dir, 'shortcuts.conf')
+        self.prefixes_dir = os.path.join(_HOME, '.local', 'share', 'wineprefixes')
+        self.skeleton_dir = os.path.join(_HOME, '.cache', 'wineapp', 'skeleton')
+        
+        self._ensure_dir(self.config_dir)
+        self._ensure_dir(self.prefixes_dir)
+        
+        self.config = dict(DEFAULT_CONFIG)
+        
+        self.shortcuts = {}
+        self._shortcuts_dirty = False
+        self._flush_pending = False
+        self._qenv_cache: Optional['QProcessEnvironment'] = None
+        self._prefix_qenv_for: Optional[str] = None
+        self._prefix_qenv: Optional['QProcessEnvironment'] = None
+        self.load_config()
+        self.load_shortcuts()
+    
+    @classmethod
+    def _ensure_dir(cls, path: str):
+        """Create path once per process"""
+        if path not in cls._dirs_checked:
+            os.makedirs(path, exist_ok=True)
+            cls._dirs_checked.add(path)
+    
+    def load_config(self):
+        """Load configuration from file"""
+        if os.path.exists(self.config_file):
+            try:
+                for key, value in _read_ini_items(self.config_file, 'Wine'):
+                    if key in self.config:
+                        try:
+                            self.config[key] = _COERCE.get(key, str)(value)
+                        except ValueError:
+                            # A bad value only costs its own key; the rest
+                            # of the file is still loaded and kept
+                            print(f"Invalid value for {key}: {value!r}, using default")
+            except ValueError:
+                # Config file is corrupted, recreate it
+                print("Config file corrupted, recreating...")
+                self.save_config()
+    
+    def save_config(self):
+        """Save configuration to file"""
+        _write_ini(self.config_file, 'Wine', self.config)
+        self._qenv_cache = None
+    
+    def qprocess_env(self) -> 'QProcessEnvironment':
+        """Return the environment for Wine processes
+        
+        Built once from the system environment and reused until the next
+        save_config().
+        """
+        if self._qenv_cache is None:
+            from PyQt6.QtCore import QProcessEnvironment
+            
+            env = QProcessEnvironment.systemEnvironment()
+            env.insert('WINEPREFIX', self.config['wine_prefix'])
+            
+            if self.config['architecture'] in ('win32', 'win64'):
+                env.insert('WINEARCH', self.config['architecture'])
+            
+            if self.config['enable_csmt']:
+                env.insert('CSMT', 'enabled')
+            
+            if self.config['enable_esync']:
+                env.insert('WINEESYNC', '1')
+            
+            if self.config['enable_fsync']:
+                env.insert('WINEFSYNC', '1')
+            
+            self._qenv_cache = env
+        
+        return self._qenv_cache
+    
+    def prefix_qprocess_env(self) -> 'QProcessEnvironment':
+        """Return the system environment with WINEPREFIX set, for tools
+        
+        Rebuilt only when wine_prefix changes.
+        """
+        prefix = self.config['wine_prefix']
+        if self._prefix_qenv is None or self._prefix_qenv_for != prefix:
+            from PyQt6.QtCore import QProcessEnvironment
+            
+            env = QProcessEnvironment.systemEnvironment()
+            env.insert('WINEPREFIX', prefix)
+            self._prefix_qenv = env
+            self._prefix_qenv_for = prefix
+        return self._prefix_qenv
+    
+    def load_shortcuts(self):
+        """Load application shortcuts"""
+        if os.path.exists(self.shortcuts_file):
+            try:
+                self.shortcuts = dict(_read_ini_items(self.shortcuts_file, 'Shortcuts'))
+            except ValueError:
+                # Shortcuts file is corrupted, recreate it
+                print("Shortcuts file corrupted, recreating...")
+                self.save_shortcuts()
+    
+    def save_shortcuts(self):
+        """Save application shortcuts"""
+        _write_ini(self.shortcuts_file, 'Shortcuts', self.shortcuts)
+        self._shortcuts_dirty = False
+    
+    def flush_shortcuts(self):
+        """Write shortcuts to disk if they changed since the last save"""
+        self._flush_pending = False
+        if self._shortcuts_dirty:
+            self.save_shortcuts()
+    
+    def _schedule_shortcuts_flush(self):
+        """Coalesce shortcut edits made within 500ms into one write"""
+        self._shortcuts_dirty = True
+        if self._flush_pending:
+            return
+        
+        try:
+            from PyQt6.QtCore import QCoreApplication, QTimer
+            has_event_loop = QCoreApplication.instance() is not None
+        except ImportError:
+            has_event_loop = False
+        
+        if not has_event_loop:
+            # Nothing would run the timer (e.g. scripts), write now
+            self.save_shortcuts()
+            return
+        
+        self._flush_pending = True
+        QTimer.singleShot(500, self.flush_shortcuts)
+    
+    def add_shortcut(self, name: str, path: str):
+        """Add application shortcut"""
+        self.shortcuts[name.lower()] = path
+        self._schedule_shortcuts_flush()
+    
+    def remove_shortcut(self, name: str):
+        """Remove application shortcut"""
+        name = name.lower()
+        if name in self.shortcuts:
+            del self.shortcuts[name]
+            self._schedule_shortcuts_flush()
+    
+    def get_shortcut(self, name: str) -> Optional[str]:
+        """Get shortcut path by name"""
+        return self.shortcuts.get(name.lower())
+    
+    def list_shortcuts(self) -> List[str]:
+        """List all shortcut names"""
+        return list(self.shortcuts.keys())
@@ -8,9 +8,12 @@ import sys
 import os
 import subprocess
 import json
-import configparser
+import ctypes
+import ctypes.util
+import selectors
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import List, Dict, Optional, Any
 
 from PyQt6.QtWidgets import (
@@ -20,253 +23,406 @@ from PyQt6.QtWidgets import (
     QCheckBox, QFileDialog, QMessageBox, QDialog, QDialogButtonBox,
     QTableWidget, QTableWidgetItem, QProgressBar, QSplitter, QFrame,
     QScrollArea, QGridLayout, QMenuBar, QMenu, QToolBar, QStatusBar,
-    QSystemTrayIcon, QStyle, QSlider, QRadioButton, QButtonGroup
+    QSystemTrayIcon, QStyle, QSlider, QRadioButton, QButtonGroup,
+    QInputDialog
 )
 from PyQt6.QtCore import (
     Qt, QThread, pyqtSignal, QTimer, QSize, QPoint, QRect,
-    QProcess, QSettings, QByteArray, QObject
+    QProcess, QProcessEnvironment, QSettings, QByteArray, QObject,
+    QFileSystemWatcher
 )
 from PyQt6.QtGui import (
     QIcon, QAction, QFont, QColor, QPalette, QPixmap,
     QTextCursor, QKeySequence, QPainter, QBrush, QPen
 )
 
+from wine_config import WineConfig
 
-class WineConfig:
-    """Wine configuration management"""
-    
-    def __init__(self, config_dir: str = None):
-        if config_dir is None:
-            self.config_dir = os.path.join(Path.home(), '.config', 'wineapp')
-        else:
-            self.config_dir = config_dir
-        
-        self.config_file = os.path.join(self.config_dir, 'wine.conf')
-        self.shortcuts_file = os.path.join(self.config_dir, 'shortcuts.conf')
-        self.prefixes_dir = os.path.join(Path.home(), '.local', 'share', 'wineprefixes')
-        
-        os.makedirs(self.config_dir, exist_ok=True)
-        os.makedirs(self.prefixes_dir, exist_ok=True)
-        
-        self.config = {
-            'wine_prefix': os.path.join(Path.home(), '.wine'),
-            'wine_binary': 'wine',
-            'architecture': 'auto',
-            'enable_virtual_desktop': False,
-            'virtual_desktop_resolution': '1024x768',
-            'enable_csmt': True,
-            'enable_dxvk': False,
-            'enable_esync': True,
-            'enable_fsync': False,
-            'audio_driver': 'alsa',
-            'graphics_driver': 'x11',
-            'nice_level': 0,
-            'debug_output': False,
-            'capture_stdout': True,
-            'capture_stderr': True
-        }
-        
-        self.shortcuts = {}
-        self.load_config()
-        self.load_shortcuts()
-    
-    def load_config(self):
-        """Load configuration from file"""
-        if os.path.exists(self.config_file):
-            parser = configparser.ConfigParser()
-            try:
-                parser.read(self.config_file)
-                
-                if 'Wine' in parser:
-                    for key, value in parser['Wine'].items():
-                        if key in self.config:
-                            if isinstance(self.config[key], bool):
-                                self.config[key] = value.lower() in ('true', 'yes', '1')
-                            elif isinstance(self.config[key], int):
-                                self.config[key] = int(value)
-                            else:
-                                self.config[key] = value
-            except configparser.MissingSectionHeaderError:
-                # Config file is corrupted, recreate it
-                print("Config file corrupted, recreating...")
-                self.save_config()
-    
-    def save_config(self):
-        """Save configuration to file"""
-        parser = configparser.ConfigParser()
-        parser['Wine'] = {}
-        
-        for key, value in self.config.items():
-            parser['Wine'][key] = str(value)
-        
-        with open(self.config_file, 'w') as f:
-            parser.write(f)
-    
-    def load_shortcuts(self):
-        """Load application shortcuts"""
-        if os.path.exists(self.shortcuts_file):
-            parser = configparser.ConfigParser()
-            try:
-                parser.read(self.shortcuts_file)
-                
-                if 'Shortcuts' in parser:
-                    self.shortcuts = dict(parser['Shortcuts'])
-            except configparser.MissingSectionHeaderError:
-                # Shortcuts file is corrupted, recreate it
-                print("Shortcuts file corrupted, recreating...")
-                self.save_shortcuts()
-    
-    def save_shortcuts(self):
-        """Save application shortcuts"""
-        parser = configparser.ConfigParser()
-        parser['Shortcuts'] = self.shortcuts
-        
-        with open(self.shortcuts_file, 'w') as f:
-            parser.write(f)
-    
-    def add_shortcut(self, name: str, path: str):
-        """Add application shortcut"""
-        self.shortcuts[name] = path
-        self.save_shortcuts()
-    
-    def remove_shortcut(self, name: str):
-        """Remove application shortcut"""
-        if name in self.shortcuts:
-            del self.shortcuts[name]
-            self.save_shortcuts()
-    
-    def get_shortcut(self, name: str) -> Optional[str]:
-        """Get shortcut path by name"""
-        return self.shortcuts.get(name)
-    
-    def list_shortcuts(self) -> List[str]:
-        """List all shortcut names"""
-        return list(self.shortcuts.keys())
+
+# libc kill(2) for checking many PIDs without an os.kill() round trip
+# and exception per dead process
+try:
+    _libc_kill = ctypes.CDLL(ctypes.util.find_library('c')).kill
+    _libc_kill.argtypes = [ctypes.c_int, ctypes.c_int]
+    _libc_kill.restype = ctypes.c_int
+except (OSError, AttributeError):
+    _libc_kill = None
+
+
+def _pids_alive(pids: List[int]) -> List[bool]:
+    """Return whether each PID still exists"""
+    if _libc_kill is not None:
+        return [_libc_kill(pid, 0) == 0 for pid in pids]
+    
+    alive = []
+    for pid in pids:
+        try:
+            os.kill(pid, 0)
+            alive.append(True)
+        except OSError:
+            alive.append(False)
+    return alive
+
+
+# Prefix directory listings keyed by path: (st_mtime_ns, names)
+_PREFIX_SCAN_CACHE: Dict[str, tuple] = {}
+
+
+def _walk_scandir(path: str):
+    """Yield (dirpath, entries) for path and every directory below it
+    
+    Like os.walk, but hands out the DirEntry objects so callers can use
+    their cached type and stat information. As with os.walk, directories
+    that cannot be listed are skipped.
+    """
+    stack = [path]
+    while stack:
+        dirpath = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        stack.extend(e.path for e in entries if e.is_dir(follow_symlinks=False))
+        yield dirpath, entries
 
 
 class ProcessMonitorThread(QThread):
-    """Thread for monitoring Wine processes"""
+    """Thread for monitoring Wine processes
+    
+    On Linux every PID is watched through a pidfd, so the thread blocks in
+    select() until the kernel reports an exit. Only while some PID could
+    not be opened as a pidfd (older kernels, other platforms) does it wake
+    every poll_interval_ms to poll. add_process() and stop() wake the
+    thread through a pipe.
+    """
     
-    process_update = pyqtSignal(dict)
     process_finished = pyqtSignal(int, int)
     
     def __init__(self):
         super().__init__()
         self.running = True
         self.processes = {}
+        self._pidfds: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.poll_interval_ms = 2000
+        self._use_pidfd = hasattr(os, 'pidfd_open')
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_w, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
     
     def add_process(self, pid: int, name: str):
         """Add process to monitor"""
         self.processes[pid] = {
             'pid': pid,
             'name': name,
-            'start_time': datetime.now(),
+            'start_time_ns': time.monotonic_ns(),
             'status': 'Running'
         }
+        
+        fd = None
+        if self._use_pidfd:
+            try:
+                fd = os.pidfd_open(pid)
+            except OSError:
+                pass
+        
+        if fd is None:
+            # Left to the polling fallback; wake run() so it starts polling
+            self._wake()
+            return
+        
+        with self._lock:
+            if self._wake_w is None:
+                # run() has finished and closed the selector
+                os.close(fd)
+                return
+            self._pidfds[pid] = fd
+            self._selector.register(fd, selectors.EVENT_READ, pid)
     
     def remove_process(self, pid: int):
         """Remove process from monitoring"""
         if pid in self.processes:
             del self.processes[pid]
+        
+        with self._lock:
+            fd = self._pidfds.pop(pid, None)
+            if fd is not None:
+                self._selector.unregister(fd)
+                os.close(fd)
     
     def run(self):
         """Monitor processes"""
+        polled = []
         while self.running:
-            dead_pids = []
+            # Block until an exit or a wake-up unless something needs polling
+            timeout = self.poll_interval_ms / 1000 if polled else None
+            for key, _ in self._selector.select(timeout=timeout):
+                if key.data is None:
+                    os.read(self._wake_r, 64)
+                else:
+                    self._process_exited(key.data)
             
-            for pid, info in list(self.processes.items()):
-                try:
-                    os.kill(pid, 0)
-                    self.process_update.emit(info)
-                except OSError:
-                    dead_pids.append(pid)
-                    self.process_finished.emit(pid, 0)
-            
-            for pid in dead_pids:
-                self.remove_process(pid)
+            if not self.running:
+                break
             
-            self.msleep(1000)
+            polled = [pid for pid in list(self.processes) if pid not in self._pidfds]
+            if polled:
+                for pid, alive in zip(polled, _pids_alive(polled)):
+                    if not alive:
+                        self._process_exited(pid)
+                polled = [pid for pid in polled if pid in self.processes]
+        
+        for pid in list(self._pidfds):
+            self.remove_process(pid)
+        
+        # Closed under the lock and cleared, so a later stop() or
+        # add_process() cannot write to a reused descriptor
+        with self._lock:
+            self._selector.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
+    
+    def _process_exited(self, pid: int):
+        """Stop watching an exited process and report it"""
+        self.remove_process(pid)
+        self.process_finished.emit(pid, 0)
     
     def stop(self):
         """Stop monitoring"""
         self.running = False
+        self._wake()
+    
+    def _wake(self):
+        """Interrupt run()'s select(), if it has not finished yet"""
+        with self._lock:
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b'\0')
+                except BlockingIOError:
+                    # Pipe full: a wake-up is already pending
+                    pass
 
 
-class WineExecutorThread(QThread):
-    """Thread for executing Wine processes"""
+class WineExecutor(QObject):
+    """Runs a Wine process through QProcess on the caller's event loop
+    
+    QProcess is already asynchronous, so no dedicated thread is needed;
+    signals are delivered on the thread that created the executor.
+    """
     
     output_ready = pyqtSignal(str)
     error_ready = pyqtSignal(str)
     process_started = pyqtSignal(int)
     process_finished = pyqtSignal(int)
     
-    def __init__(self, exe_path: str, args: List[str], config: Dict[str, Any]):
-        super().__init__()
+    def __init__(self, exe_path: str, args: List[str], config: WineConfig, parent=None):
+        super().__init__(parent)
         self.exe_path = exe_path
         self.args = args
-        self.config = config
-        self.process = None
-    
-    def run(self):
-        """Execute Wine process"""
-        self.process = QProcess()
-        
-        env = QProcess.systemEnvironment()
-        env.append(f"WINEPREFIX={self.config['wine_prefix']}")
-        
-        if self.config['architecture'] == 'win32':
-            env.append("WINEARCH=win32")
-        elif self.config['architecture'] == 'win64':
-            env.append("WINEARCH=win64")
-        
-        if self.config['enable_csmt']:
-            env.append("CSMT=enabled")
-        
-        if self.config['enable_esync']:
-            env.append("WINEESYNC=1")
-        
-        if self.config['enable_fsync']:
-            env.append("WINEFSYNC=1")
-        
-        self.process.setEnvironment(env)
+        self.config_obj = config
+        self.config = config.config
         
+        self.process = QProcess(self)
         self.process.readyReadStandardOutput.connect(self._handle_stdout)
         self.process.readyReadStandardError.connect(self._handle_stderr)
+        self.process.started.connect(self._handle_started)
         self.process.finished.connect(self._handle_finished)
         
+        # Output is buffered and emitted at most every 50ms so chatty
+        # processes don't trigger a decode and a signal per read
+        self._stdout_buf = bytearray()
+        self._stderr_buf = bytearray()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_output)
+    
+    def start(self):
+        """Execute Wine process"""
+        self.process.setProcessEnvironment(self.config_obj.qprocess_env())
+        
         command = [self.config['wine_binary'], self.exe_path] + self.args
         
         self.process.start(command[0], command[1:])
-        
-        if self.process.waitForStarted():
-            pid = self.process.processId()
-            self.process_started.emit(pid)
-        
-        self.exec()
+    
+    def _handle_started(self):
+        """Handle process started"""
+        self.process_started.emit(self.process.processId())
     
     def _handle_stdout(self):
         """Handle standard output"""
-        data = self.process.readAllStandardOutput()
-        text = bytes(data).decode('utf-8', errors='ignore')
-        self.output_ready.emit(text)
+        self._stdout_buf += self.process.readAllStandardOutput().data()
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
     
     def _handle_stderr(self):
         """Handle standard error"""
-        data = self.process.readAllStandardError()
-        text = bytes(data).decode('utf-8', errors='ignore')
-        self.error_ready.emit(text)
+        self._stderr_buf += self.process.readAllStandardError().data()
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_output(self):
+        """Decode and emit everything buffered since the last flush"""
+        if self._stdout_buf:
+            self.output_ready.emit(self._stdout_buf.decode('utf-8', errors='ignore'))
+            self._stdout_buf.clear()
+        
+        if self._stderr_buf:
+            self.error_ready.emit(self._stderr_buf.decode('utf-8', errors='ignore'))
+            self._stderr_buf.clear()
     
     def _handle_finished(self):
         """Handle process finished"""
+        self._flush_timer.stop()
+        self._flush_output()
+        
         exit_code = self.process.exitCode()
         self.process_finished.emit(exit_code)
     
     def terminate_process(self):
         """Terminate the process"""
-        if self.process and self.process.state() == QProcess.ProcessState.Running:
+        if self.process.state() == QProcess.ProcessState.Running:
             self.process.terminate()
-            if not self.process.waitForFinished(3000):
-                self.process.kill()
+            QTimer.singleShot(3000, self._kill_if_running)
+    
+    def _kill_if_running(self):
+        """Kill the process if it ignored terminate()"""
+        if self.process.state() == QProcess.ProcessState.Running:
+            self.process.kill()
+
+
+class PrefixCloneThread(QThread):
+    """Thread for copying a Wine prefix"""
+    
+    clone_finished = pyqtSignal(str)
+    
+    def __init__(self, source_path: str, dest_path: str, parent=None):
+        super().__init__(parent)
+        self.source_path = source_path
+        self.dest_path = dest_path
+    
+    def run(self):
+        """Copy the prefix, emitting an error message or '' on success"""
+        import shutil
+        
+        try:
+            if not self._reflink_copy():
+                shutil.copytree(
+                    self.source_path, self.dest_path,
+                    symlinks=True, copy_function=shutil.copyfile
+                )
+            self.clone_finished.emit('')
+        except Exception as e:
+            self.clone_finished.emit(str(e))
+    
+    def _reflink_copy(self) -> bool:
+        """Copy with GNU cp, which shares extents on btrfs/xfs"""
+        import shutil
+        
+        if shutil.which('cp') is None:
+            return False
+        
+        result = subprocess.run(
+            ['cp', '--reflink=auto', '-a', self.source_path, self.dest_path],
+            stderr=subprocess.DEVNULL
+        )
+        if result.returncode != 0:
+            # Non-GNU cp: discard any partial copy and use shutil instead
+            shutil.rmtree(self.dest_path, ignore_errors=True)
+            return False
+        return True
+
+
+class PrefixDeleteThread(QThread):
+    """Thread for removing a Wine prefix"""
+    
+    delete_finished = pyqtSignal(str)
+    
+    def __init__(self, prefix_path: str, parent=None):
+        super().__init__(parent)
+        self.prefix_path = prefix_path
+    
+    def run(self):
+        """Delete the prefix, emitting an error message or '' on success"""
+        import shutil
+        
+        try:
+            if shutil.which('rm') is not None:
+                subprocess.run(
+                    ['rm', '-rf', '--', self.prefix_path],
+                    check=True, stderr=subprocess.PIPE
+                )
+            else:
+                shutil.rmtree(self.prefix_path)
+            self.delete_finished.emit('')
+        except subprocess.CalledProcessError as e:
+            self.delete_finished.emit(e.stderr.decode('utf-8', errors='ignore').strip())
+        except Exception as e:
+            self.delete_finished.emit(str(e))
+
+
+class DirSizeThread(QThread):
+    """Thread for summing the size of the files below a directory"""
+    
+    size_ready = pyqtSignal(int)
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+    
+    def run(self):
+        """Walk the tree and emit the total, unless interrupted"""
+        total = 0
+        for _, entries in _walk_scandir(self.path):
+            if self.isInterruptionRequested():
+                return
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+        self.size_ready.emit(total)
+
+
+class CleanupThread(QThread):
+    """Thread for emptying a prefix's temporary directories"""
+    
+    progress = pyqtSignal(int)
+    done = pyqtSignal(int)
+    
+    def __init__(self, temp_dirs: List[str]):
+        super().__init__()
+        self.temp_dirs = temp_dirs
+    
+    def run(self):
+        """Remove every item in the temp directories, emitting the count"""
+        import shutil
+        
+        cleaned = 0
+        for temp_dir in self.temp_dirs:
+            try:
+                with os.scandir(temp_dir) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            # DirEntry already knows each item's type, no stat per item
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                    cleaned += 1
+                    self.progress.emit(cleaned)
+                except Exception:
+                    pass
+        
+        self.done.emit(cleaned)
 
 
 class AddShortcutDialog(QDialog):
@@ -324,6 +480,14 @@ class PrefixManagerDialog(QDialog):
     def __init__(self, config: WineConfig, parent=None):
         super().__init__(parent)
         self.config = config
+        self._size_cache: Dict[str, tuple] = {}
+        # Background work, parented to the dialog; it stays open until done
+        self.wineboot = None
+        self.seed_thread = None
+        self.wineserver_wait = None
+        self.skeleton_thread = None
+        self.clone_thread = None
+        self.delete_thread = None
         self.setWindowTitle("Wine Prefix Manager")
         self.setModal(True)
         self.resize(700, 500)
@@ -338,17 +502,20 @@ class PrefixManagerDialog(QDialog):
         
         self.prefix_list = QListWidget()
         self.refresh_prefix_list()
+        
+        self.prefix_watcher = QFileSystemWatcher([self.config.prefixes_dir], self)
+        self.prefix_watcher.directoryChanged.connect(self.refresh_prefix_list)
         list_layout.addWidget(self.prefix_list)
         
         button_layout = QVBoxLayout()
         
-        create_btn = QPushButton("Create New")
-        create_btn.clicked.connect(self.create_prefix)
-        button_layout.addWidget(create_btn)
+        self.create_btn = QPushButton("Create New")
+        self.create_btn.clicked.connect(self.create_prefix)
+        button_layout.addWidget(self.create_btn)
         
-        delete_btn = QPushButton("Delete")
-        delete_btn.clicked.connect(self.delete_prefix)
-        button_layout.addWidget(delete_btn)
+        self.delete_btn = QPushButton("Delete")
+        self.delete_btn.clicked.connect(self.delete_prefix)
+        button_layout.addWidget(self.delete_btn)
         
         switch_btn = QPushButton("Switch To")
         switch_btn.clicked.connect(self.switch_prefix)
@@ -358,35 +525,77 @@ class PrefixManagerDialog(QDialog):
         info_btn.clicked.connect(self.show_prefix_info)
         button_layout.addWidget(info_btn)
         
-        clone_btn = QPushButton("Clone")
-        clone_btn.clicked.connect(self.clone_prefix)
-        button_layout.addWidget(clone_btn)
+        self.clone_btn = QPushButton("Clone")
+        self.clone_btn.clicked.connect(self.clone_prefix)
+        button_layout.addWidget(self.clone_btn)
         
         button_layout.addStretch()
         
         list_layout.addLayout(button_layout)
         layout.addLayout(list_layout)
         
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        layout.addWidget(close_btn)
+        self.busy_bar = QProgressBar()
+        self.busy_bar.setRange(0, 0)
+        self.busy_bar.hide()
+        layout.addWidget(self.busy_bar)
+        
+        self.close_btn = QPushButton("Close")
+        self.close_btn.clicked.connect(self.accept)
+        layout.addWidget(self.close_btn)
         
         self.setLayout(layout)
     
+    def set_busy(self, busy: bool):
+        """Show the busy bar and lock out other prefix operations"""
+        self.busy_bar.setVisible(busy)
+        self.create_btn.setEnabled(not busy)
+        self.delete_btn.setEnabled(not busy)
+        self.clone_btn.setEnabled(not busy)
+        self.close_btn.setEnabled(not busy)
+    
+    def _working(self) -> bool:
+        """Whether any process or thread of the dialog is still running"""
+        for process in (self.wineboot, self.wineserver_wait):
+            if process is not None and process.state() != QProcess.ProcessState.NotRunning:
+                return True
+        return any(
+            thread is not None and thread.isRunning()
+            for thread in (self.seed_thread, self.skeleton_thread,
+                           self.clone_thread, self.delete_thread)
+        )
+    
+    def done(self, result):
+        """Close the dialog, unless a prefix operation is still running
+        
+        Nothing is waited for here: wineboot can sit on the Mono/Gecko
+        prompt indefinitely, and blocking on it would freeze the app.
+        """
+        if self._working():
+            return
+        super().done(result)
+    
     def refresh_prefix_list(self):
         """Refresh the prefix list"""
         self.prefix_list.clear()
         
-        if os.path.exists(self.config.prefixes_dir):
-            for entry in os.listdir(self.config.prefixes_dir):
-                prefix_path = os.path.join(self.config.prefixes_dir, entry)
-                if os.path.isdir(prefix_path):
-                    self.prefix_list.addItem(entry)
+        prefixes_dir = self.config.prefixes_dir
+        try:
+            mtime_ns = os.stat(prefixes_dir).st_mtime_ns
+        except FileNotFoundError:
+            return
+        
+        cached = _PREFIX_SCAN_CACHE.get(prefixes_dir)
+        if cached and cached[0] == mtime_ns:
+            names = cached[1]
+        else:
+            with os.scandir(prefixes_dir) as it:
+                names = [e.name for e in it if e.is_dir()]
+            _PREFIX_SCAN_CACHE[prefixes_dir] = (mtime_ns, names)
+        
+        self.prefix_list.addItems(names)
     
     def create_prefix(self):
         """Create new Wine prefix"""
-        from PyQt6.QtWidgets import QInputDialog
-        
         name, ok = QInputDialog.getText(self, "Create Prefix", "Enter prefix name:")
         if ok and name:
             prefix_path = os.path.join(self.config.prefixes_dir, name)
@@ -395,17 +604,114 @@ class PrefixManagerDialog(QDialog):
                 QMessageBox.warning(self, "Error", f"Prefix '{name}' already exists")
                 return
             
-            os.makedirs(prefix_path, exist_ok=True)
-            
-            env = os.environ.copy()
-            env['WINEPREFIX'] = prefix_path
+            self.set_busy(True)
             
+            if os.path.isdir(self.config.skeleton_dir):
+                # Start from a copy of an already booted prefix so wineboot
+                # only has to apply updates
+                self.seed_thread = PrefixCloneThread(self.config.skeleton_dir, prefix_path, self)
+                self.seed_thread.clone_finished.connect(
+                    lambda error: self._start_wineboot(name, prefix_path, seeded=not error)
+                )
+                self.seed_thread.start()
+            else:
+                self._start_wineboot(name, prefix_path, seeded=False)
+    
+    def _prefix_process(self, prefix_path: str) -> QProcess:
+        """Return a QProcess that runs in the given prefix"""
+        env = QProcessEnvironment.systemEnvironment()
+        env.insert('WINEPREFIX', prefix_path)
+        
+        process = QProcess(self)
+        process.setProcessEnvironment(env)
+        return process
+    
+    def _start_wineboot(self, name: str, prefix_path: str, seeded: bool):
+        """Run wineboot -u for a new prefix without blocking the dialog"""
+        os.makedirs(prefix_path, exist_ok=True)
+        
+        self.wineboot = self._prefix_process(prefix_path)
+        self.wineboot.finished.connect(
+            lambda exit_code, _: self._wineboot_finished(name, prefix_path, seeded, exit_code)
+        )
+        self.wineboot.errorOccurred.connect(
+            lambda error: self._wineboot_failed(name, error)
+        )
+        self.wineboot.start('wineboot', ['-u'])
+    
+    def _wineboot_failed(self, name: str, error):
+        """Handle wineboot failing to start"""
+        if error == QProcess.ProcessError.FailedToStart:
+            self.set_busy(False)
+            QMessageBox.critical(self, "Error", f"Failed to create prefix '{name}'")
+    
+    def _wineboot_finished(self, name: str, prefix_path: str, seeded: bool, exit_code: int):
+        """Handle wineboot completion for a new prefix"""
+        if exit_code != 0:
+            self.set_busy(False)
+            QMessageBox.critical(self, "Error", f"Failed to create prefix '{name}'")
+            return
+        
+        # Saving the skeleton keeps the dialog busy until it is published
+        if seeded or os.path.exists(self.config.skeleton_dir) or not self._save_skeleton(prefix_path):
+            self.set_busy(False)
+        
+        QMessageBox.information(self, "Success", f"Created prefix '{name}'")
+        self.refresh_prefix_list()
+    
+    def _save_skeleton(self, prefix_path: str) -> bool:
+        """Start keeping a copy of a freshly booted prefix to seed future ones
+        
+        Returns False if an earlier save is still in progress.
+        """
+        # A copy from an earlier prefix may still be writing to staging
+        if self.skeleton_thread is not None and self.skeleton_thread.isRunning():
+            return False
+        if self.wineserver_wait is not None and self.wineserver_wait.state() != QProcess.ProcessState.NotRunning:
+            return False
+        
+        # wineserver writes system.reg/user.reg only when it shuts down (or
+        # on its periodic save), so wait for it before copying the prefix
+        self.wineserver_wait = self._prefix_process(prefix_path)
+        self.wineserver_wait.finished.connect(
+            lambda exit_code, _: self._copy_skeleton(prefix_path)
+        )
+        self.wineserver_wait.errorOccurred.connect(self._wineserver_wait_failed)
+        self.wineserver_wait.start('wineserver', ['-w'])
+        return True
+    
+    def _wineserver_wait_failed(self, error):
+        """Give up on the skeleton if wineserver -w cannot be started"""
+        if error == QProcess.ProcessError.FailedToStart:
+            self.set_busy(False)
+    
+    def _copy_skeleton(self, prefix_path: str):
+        """Copy the prefix into the skeleton's staging directory"""
+        import shutil
+        
+        staging = self.config.skeleton_dir + '.tmp'
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(os.path.dirname(staging), exist_ok=True)
+        
+        self.skeleton_thread = PrefixCloneThread(prefix_path, staging, self)
+        self.skeleton_thread.clone_finished.connect(
+            lambda error: self._publish_skeleton(staging, error)
+        )
+        self.skeleton_thread.start()
+    
+    def _publish_skeleton(self, staging: str, error: str):
+        """Move a complete staging copy into place, or discard it"""
+        import shutil
+        
+        self.set_busy(False)
+        if not error:
             try:
-                subprocess.run(['wineboot', '-u'], env=env, check=True)
-                QMessageBox.information(self, "Success", f"Created prefix '{name}'")
-                self.refresh_prefix_list()
-            except subprocess.CalledProcessError:
-                QMessageBox.critical(self, "Error", f"Failed to create prefix '{name}'")
+                os.replace(staging, self.config.skeleton_dir)
+                return
+            except OSError:
+                # Another skeleton was published in the meantime
+                pass
+        shutil.rmtree(staging, ignore_errors=True)
     
     def delete_prefix(self):
         """Delete selected Wine prefix"""
@@ -424,13 +730,22 @@ class PrefixManagerDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             prefix_path = os.path.join(self.config.prefixes_dir, name)
-            try:
-                import shutil
-                shutil.rmtree(prefix_path)
-                QMessageBox.information(self, "Success", f"Deleted prefix '{name}'")
-                self.refresh_prefix_list()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete prefix: {str(e)}")
+            
+            self.set_busy(True)
+            self.delete_thread = PrefixDeleteThread(prefix_path, self)
+            self.delete_thread.delete_finished.connect(
+                lambda error: self._delete_finished(name, error)
+            )
+            self.delete_thread.start()
+    
+    def _delete_finished(self, name: str, error: str):
+        """Handle delete thread result"""
+        self.set_busy(False)
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to delete prefix: {error}")
+        else:
+            QMessageBox.information(self, "Success", f"Deleted prefix '{name}'")
+            self.refresh_prefix_list()
     
     def switch_prefix(self):
         """Switch to selected Wine prefix"""
@@ -475,7 +790,6 @@ class PrefixManagerDialog(QDialog):
         
         source_name = current_item.text()
         
-        from PyQt6.QtWidgets import QInputDialog
         new_name, ok = QInputDialog.getText(self, "Clone Prefix", "Enter new prefix name:")
         
         if ok and new_name:
@@ -486,20 +800,37 @@ class PrefixManagerDialog(QDialog):
                 QMessageBox.warning(self, "Error", f"Prefix '{new_name}' already exists")
                 return
             
-            try:
-                import shutil
-                shutil.copytree(source_path, dest_path)
-                QMessageBox.information(self, "Success", f"Cloned prefix to '{new_name}'")
-                self.refresh_prefix_list()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to clone prefix: {str(e)}")
+            self.set_busy(True)
+            self.clone_thread = PrefixCloneThread(source_path, dest_path, self)
+            self.clone_thread.clone_finished.connect(
+                lambda error: self._clone_finished(new_name, error)
+            )
+            self.clone_thread.start()
+    
+    def _clone_finished(self, new_name: str, error: str):
+        """Handle clone thread result"""
+        self.set_busy(False)
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to clone prefix: {error}")
+        else:
+            QMessageBox.information(self, "Success", f"Cloned prefix to '{new_name}'")
+            self.refresh_prefix_list()
     
     def get_directory_size(self, path):
-        """Calculate directory size"""
+        """Calculate directory size, memoized on the directory's mtime"""
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._size_cache.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
         total = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.exists(filepath):
-                    total += os.path.getsize(filepath)
+        for _, entries in _walk_scandir(path):
+            for entry in entries:
+                # Files can vanish or be unreadable mid-walk
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    pass
+        self._size_cache[path] = (mtime_ns, total)
         return total
@@ -6,27 +6,105 @@ Wine Application Manager - Main GUI Window
 import sys
 import os
 import subprocess
-import threading
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QTextEdit, QListWidget, QTreeWidget,
+    QPushButton, QLabel, QLineEdit, QTextEdit, QListWidget, QListWidgetItem, QTreeWidget,
     QTreeWidgetItem, QTabWidget, QGroupBox, QComboBox, QSpinBox,
     QCheckBox, QFileDialog, QMessageBox, QDialog, QDialogButtonBox,
     QTableWidget, QTableWidgetItem, QProgressBar, QSplitter, QFrame,
     QScrollArea, QGridLayout, QMenuBar, QMenu, QToolBar, QStatusBar,
-    QSystemTrayIcon, QStyle
+    QSystemTrayIcon, QStyle, QTableView, QStyledItemDelegate,
+    QStyleOptionButton
+)
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, QAbstractTableModel, QModelIndex, QEvent, QProcess,
+    pyqtSignal
 )
-from PyQt6.QtCore import Qt, QTimer, QSize
 from PyQt6.QtGui import QIcon, QAction, QFont, QColor, QPalette, QTextCursor
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from wine_config import DEFAULT_CONFIG
 from wine_gui import (
-    WineConfig, ProcessMonitorThread, WineExecutorThread,
+    WineConfig, ProcessMonitorThread, WineExecutor,
     AddShortcutDialog, PrefixManagerDialog
 )
 
+# wine-cli sits next to this script; the path never changes at runtime
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_CLI_PATH = os.path.join(_SCRIPT_DIR, 'bin', 'wine-cli')
+_cli_found = False
+
+# Button styles for the tabs, keyed by objectName. Part of the application
+# stylesheet, so it is parsed once rather than per widget.
+TAB_QSS = """
+    QPushButton#runBtn {
+        background-color: #4CAF50;
+        color: white;
+        font-weight: bold;
+        padding: 5px 15px;
+    }
+    QPushButton#killAllBtn {
+        background-color: #f44336;
+        color: white;
+    }
+"""
+
+_HAVE_PROC = os.path.isdir('/proc/self')
+# wine, wine64, wineserver, winedbg, wine-preloader, ...
+_WINE_COMM_PREFIXES = ('wine',)
+# The kernel cuts comm to 15 bytes
+_COMM_LEN = 15
+
+
+def _cli_available() -> bool:
+    """Whether bin/wine-cli exists; re-checked only until it is found"""
+    global _cli_found
+    if not _cli_found:
+        _cli_found = os.path.exists(_CLI_PATH)
+    return _cli_found
+
+
+def _program_name(argv0: str) -> str:
+    """Return the file name of argv[0], which is a Windows path under Wine"""
+    return argv0.replace('\\', '/').rsplit('/', 1)[-1]
+
+
+def _is_wine_process(name: str, argv0: str = '') -> bool:
+    """Whether a short process name (comm) belongs to Wine
+    
+    Shared by every process listing so they all select the same set:
+    Wine's own binaries plus the Windows programs it runs. A comm of
+    _COMM_LEN characters may have lost its '.exe', so callers pass argv0
+    for those and its file name is checked instead.
+    """
+    name = name.lower()
+    if name.startswith(_WINE_COMM_PREFIXES) or name.endswith('.exe'):
+        return True
+    return len(name) == _COMM_LEN and _program_name(argv0).lower().endswith('.exe')
+
+
+def _etime_seconds(etime: str) -> int:
+    """Convert ps etime ([[dd-]hh:]mm:ss) to seconds"""
+    days, _, clock = etime.rpartition('-')
+    seconds = 0
+    for field in clock.split(':'):
+        seconds = seconds * 60 + int(field)
+    return seconds + int(days or 0) * 86400
+
+
+def _format_start_time(timestamp: float) -> str:
+    """Format a process start time (seconds since the epoch) for the table"""
+    return datetime.fromtimestamp(timestamp).strftime('%H:%M')
+
 
 class ConfigurationTab(QWidget):
     """Configuration tab widget"""
@@ -34,7 +112,18 @@ class ConfigurationTab(QWidget):
     def __init__(self, config: WineConfig):
         super().__init__()
         self.config = config
-        self.init_ui()
+        self._built = False
+        self._prefix_dialog = None
+    
+    def showEvent(self, event):
+        """Build the widgets the first time the tab is shown"""
+        self._ensure_built()
+        super().showEvent(event)
+    
+    def _ensure_built(self):
+        if not self._built:
+            self._built = True
+            self.init_ui()
     
     def init_ui(self):
         """Initialize UI"""
@@ -165,78 +254,84 @@ class ConfigurationTab(QWidget):
         
         layout.addWidget(scroll)
         self.setLayout(layout)
+        
+        # (config key, getter, setter) for every field; save and reset
+        # both go through this table
+        self._bindings = (
+            ('wine_prefix', self.prefix_edit.text, self.prefix_edit.setText),
+            ('wine_binary', self.wine_binary_edit.text, self.wine_binary_edit.setText),
+            ('architecture', self.arch_combo.currentText, self.arch_combo.setCurrentText),
+            ('enable_virtual_desktop', self.virtual_desktop_check.isChecked, self.virtual_desktop_check.setChecked),
+            ('virtual_desktop_resolution', self.resolution_edit.text, self.resolution_edit.setText),
+            ('graphics_driver', self.graphics_combo.currentText, self.graphics_combo.setCurrentText),
+            ('enable_csmt', self.csmt_check.isChecked, self.csmt_check.setChecked),
+            ('enable_esync', self.esync_check.isChecked, self.esync_check.setChecked),
+            ('enable_fsync', self.fsync_check.isChecked, self.fsync_check.setChecked),
+            ('enable_dxvk', self.dxvk_check.isChecked, self.dxvk_check.setChecked),
+            ('nice_level', self.nice_spin.value, self.nice_spin.setValue),
+            ('audio_driver', self.audio_combo.currentText, self.audio_combo.setCurrentText),
+            ('debug_output', self.debug_check.isChecked, self.debug_check.setChecked),
+            ('capture_stdout', self.capture_stdout_check.isChecked, self.capture_stdout_check.setChecked),
+            ('capture_stderr', self.capture_stderr_check.isChecked, self.capture_stderr_check.setChecked),
+        )
     
     def browse_prefix(self):
         """Browse for Wine prefix directory"""
-        directory = QFileDialog.getExistingDirectory(self, "Select Wine Prefix Directory")
-        if directory:
-            self.prefix_edit.setText(directory)
+        # Created on first use and reused; it keeps the last directory
+        if self._prefix_dialog is None:
+            self._prefix_dialog = QFileDialog(self, "Select Wine Prefix Directory")
+            self._prefix_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._prefix_dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        
+        if self._prefix_dialog.exec() == QDialog.DialogCode.Accepted:
+            directory = self._prefix_dialog.selectedFiles()[0]
+            if directory:
+                self.prefix_edit.setText(directory)
     
     def save_configuration(self):
         """Save configuration"""
-        self.config.config['wine_prefix'] = self.prefix_edit.text()
-        self.config.config['wine_binary'] = self.wine_binary_edit.text()
-        self.config.config['architecture'] = self.arch_combo.currentText()
-        self.config.config['enable_virtual_desktop'] = self.virtual_desktop_check.isChecked()
-        self.config.config['virtual_desktop_resolution'] = self.resolution_edit.text()
-        self.config.config['graphics_driver'] = self.graphics_combo.currentText()
-        self.config.config['enable_csmt'] = self.csmt_check.isChecked()
-        self.config.config['enable_esync'] = self.esync_check.isChecked()
-        self.config.config['enable_fsync'] = self.fsync_check.isChecked()
-        self.config.config['enable_dxvk'] = self.dxvk_check.isChecked()
-        self.config.config['nice_level'] = self.nice_spin.value()
-        self.config.config['audio_driver'] = self.audio_combo.currentText()
-        self.config.config['debug_output'] = self.debug_check.isChecked()
-        self.config.config['capture_stdout'] = self.capture_stdout_check.isChecked()
-        self.config.config['capture_stderr'] = self.capture_stderr_check.isChecked()
-        
-        self.config.save_config()
+        new_config = {key: getter() for key, getter, _setter in self._bindings}
+        
+        changed = {
+            key: value for key, value in new_config.items()
+            if self.config.config.get(key) != value
+        }
+        if changed:
+            self.config.config.update(changed)
+            self.config.save_config()
         
-        QMessageBox.information(self, "Success", "Configuration saved successfully")
+        # Window-modal and non-blocking: no nested event loop
+        box = QMessageBox(
+            QMessageBox.Icon.Information, "Success",
+            "Configuration saved successfully",
+            QMessageBox.StandardButton.Ok, self
+        )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
     
     def reset_configuration(self):
         """Reset configuration to defaults"""
-        reply = QMessageBox.question(
-            self, "Confirm Reset",
+        box = QMessageBox(
+            QMessageBox.Icon.Question, "Confirm Reset",
             "Are you sure you want to reset all settings to defaults?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self
         )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         
-        if reply == QMessageBox.StandardButton.Yes:
-            self.config.config = {
-                'wine_prefix': os.path.join(Path.home(), '.wine'),
-                'wine_binary': 'wine',
-                'architecture': 'auto',
-                'enable_virtual_desktop': False,
-                'virtual_desktop_resolution': '1024x768',
-                'enable_csmt': True,
-                'enable_dxvk': False,
-                'enable_esync': True,
-                'enable_fsync': False,
-                'audio_driver': 'alsa',
-                'graphics_driver': 'x11',
-                'nice_level': 0,
-                'debug_output': False,
-                'capture_stdout': True,
-                'capture_stderr': True
-            }
-            self.config.save_config()
-            
-            self.prefix_edit.setText(self.config.config['wine_prefix'])
-            self.wine_binary_edit.setText(self.config.config['wine_binary'])
-            self.arch_combo.setCurrentText(self.config.config['architecture'])
-            self.virtual_desktop_check.setChecked(self.config.config['enable_virtual_desktop'])
-            self.resolution_edit.setText(self.config.config['virtual_desktop_resolution'])
-            self.graphics_combo.setCurrentText(self.config.config['graphics_driver'])
-            self.csmt_check.setChecked(self.config.config['enable_csmt'])
-            self.esync_check.setChecked(self.config.config['enable_esync'])
-            self.fsync_check.setChecked(self.config.config['enable_fsync'])
-            self.dxvk_check.setChecked(self.config.config['enable_dxvk'])
-            self.nice_spin.setValue(self.config.config['nice_level'])
-            self.audio_combo.setCurrentText(self.config.config['audio_driver'])
-            self.debug_check.setChecked(self.config.config['debug_output'])
-            self.capture_stdout_check.setChecked(self.config.config['capture_stdout'])
-            self.capture_stderr_check.setChecked(self.config.config['capture_stderr'])
+        def on_clicked(button):
+            if box.standardButton(button) == QMessageBox.StandardButton.Yes:
+                self._apply_default_config()
+        
+        box.buttonClicked.connect(on_clicked)
+        box.open()
+    
+    def _apply_default_config(self):
+        """Save the default configuration and show it in the widgets"""
+        self.config.config = dict(DEFAULT_CONFIG)
+        self.config.save_config()
+        
+        for key, _getter, setter in self._bindings:
+            setter(self.config.config[key])
 
 
 class ApplicationsTab(QWidget):
@@ -246,6 +341,22 @@ class ApplicationsTab(QWidget):
         super().__init__(parent)
         self.config = config
         self.parent_window = parent
+        self._cli_processes = []
+        
+        # Model of record for recent_list, newest first
+        self._recent = deque(maxlen=10)
+        self._recent_set = set()
+        
+        # Shortcut name -> its item in shortcuts_list
+        self._shortcut_items = {}
+        self._exe_dialog = None
+        
+        # wine-cli output is coalesced into one log append per 50ms
+        self._log_buf = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_log)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -263,7 +374,7 @@ class ApplicationsTab(QWidget):
         top_layout.addWidget(browse_btn)
         
         run_btn = QPushButton("Run")
-        run_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; font-weight: bold; padding: 5px 15px; }")
+        run_btn.setObjectName("runBtn")
         run_btn.clicked.connect(self.run_executable)
         top_layout.addWidget(run_btn)
         
@@ -317,11 +428,18 @@ class ApplicationsTab(QWidget):
     
     def browse_executable(self):
         """Browse for executable file"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Executable", "", "Windows Executables (*.exe *.msi);;All Files (*)"
-        )
-        if file_path:
-            self.exe_edit.setText(file_path)
+        # Created on first use and reused; it keeps the last directory
+        if self._exe_dialog is None:
+            self._exe_dialog = QFileDialog(self, "Select Executable")
+            self._exe_dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+            self._exe_dialog.setNameFilters(
+                ["Windows Executables (*.exe *.msi)", "All Files (*)"]
+            )
+        
+        if self._exe_dialog.exec() == QDialog.DialogCode.Accepted:
+            file_path = self._exe_dialog.selectedFiles()[0]
+            if file_path:
+                self.exe_edit.setText(file_path)
     
     def run_executable(self):
         """Run the selected executable"""
@@ -338,14 +456,11 @@ class ApplicationsTab(QWidget):
         args = self.args_edit.text().split() if self.args_edit.text() else []
         
         # Use wine-cli for execution
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        cli_path = os.path.join(script_dir, 'bin', 'wine-cli')
-        
-        if os.path.exists(cli_path):
+        if _cli_available():
             # Use CLI for better integration
             if self.parent_window:
                 self.parent_window.log_tab.append_log(f"Using wine-cli to run: {exe_path}", "#4CAF50")
-            self.run_via_cli(cli_path, exe_path, args)
+            self.run_via_cli(_CLI_PATH, exe_path, args)
         else:
             # Fallback to direct execution
             if self.parent_window:
@@ -355,33 +470,59 @@ class ApplicationsTab(QWidget):
     
     def run_via_cli(self, cli_path, exe_path, args):
         """Run executable via wine-cli"""
-        try:
-            cmd = [cli_path, 'run', exe_path] + args
-            
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
-            )
-            
-            if self.parent_window:
-                self.parent_window.log_tab.append_log(f"Process started with PID: {process.pid}", "#4CAF50")
-                
-                # Read output in background
-                def read_output():
-                    for line in process.stdout:
-                        if line.strip():
-                            self.parent_window.log_tab.append_log(line.strip(), "#d4d4d4")
-                    process.wait()
-                    self.parent_window.log_tab.append_log(f"Process exited with code: {process.returncode}", "#FF9800")
-                
-                import threading
-                thread = threading.Thread(target=read_output, daemon=True)
-                thread.start()
-        except Exception as e:
-            if self.parent_window:
-                self.parent_window.log_tab.append_log(f"Error: {str(e)}", "#f44336")
+        process = QProcess(self)
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.MergedChannels)
+        process.readyReadStandardOutput.connect(lambda: self._cli_output(process))
+        process.finished.connect(lambda code, _status: self._cli_finished(process, code))
+        process.errorOccurred.connect(lambda error: self._cli_error(process, error))
+        process.started.connect(lambda: self._cli_started(process))
+        self._cli_processes.append(process)
+        
+        process.start(cli_path, ['run', exe_path] + args)
+    
+    def _cli_started(self, process: QProcess):
+        if self.parent_window:
+            self.parent_window.log_tab.append_log(f"Process started with PID: {process.processId()}", "#4CAF50")
+    
+    def _cli_output(self, process: QProcess):
+        """Buffer the complete lines wine-cli has written so far"""
+        while process.canReadLine():
+            line = bytes(process.readLine()).decode(errors='replace').strip()
+            if line:
+                self._log_buf.append(line)
+        if self._log_buf and not self._flush_timer.isActive():
+            self._flush_timer.start(50)
+    
+    def _flush_log(self):
+        """Append all buffered wine-cli output in a single log edit"""
+        self._flush_timer.stop()
+        if self._log_buf and self.parent_window:
+            self.parent_window.log_tab.append_log("\n".join(self._log_buf), "#d4d4d4")
+        self._log_buf.clear()
+    
+    def _cli_finished(self, process: QProcess, exit_code: int):
+        """Flush any trailing output and report the exit code"""
+        self._cli_output(process)
+        tail = bytes(process.readAllStandardOutput()).decode(errors='replace').strip()
+        if tail:
+            self._log_buf.append(tail)
+        self._flush_log()
+        if self.parent_window:
+            self.parent_window.log_tab.append_log(f"Process exited with code: {exit_code}", "#FF9800")
+        self._release_cli_process(process)
+    
+    def _cli_error(self, process: QProcess, error):
+        """Report wine-cli failing to start; other errors end in finished"""
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        if self.parent_window:
+            self.parent_window.log_tab.append_log(f"Error: {process.errorString()}", "#f44336")
+        self._release_cli_process(process)
+    
+    def _release_cli_process(self, process: QProcess):
+        if process in self._cli_processes:
+            self._cli_processes.remove(process)
+            process.deleteLater()
     
     def add_shortcut(self):
         """Add new shortcut"""
@@ -389,8 +530,15 @@ class ApplicationsTab(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             name, path = dialog.get_values()
             if name and path:
+                # Stored lowercased, so the list shows what a reload would
+                name = name.lower()
                 self.config.add_shortcut(name, path)
-                self.refresh_shortcuts()
+                item = self._shortcut_items.get(name)
+                if item is None:
+                    self._add_shortcut_item(name, path)
+                else:
+                    item.setText(f"{name} -> {path}")
+                    item.setData(Qt.ItemDataRole.UserRole, (name, path))
     
     def remove_shortcut(self):
         """Remove selected shortcut"""
@@ -399,7 +547,7 @@ class ApplicationsTab(QWidget):
             QMessageBox.warning(self, "Warning", "Please select a shortcut to remove")
             return
         
-        name = current_item.text().split(" -> ")[0]
+        name, _path = current_item.data(Qt.ItemDataRole.UserRole)
         
         reply = QMessageBox.question(
             self, "Confirm Remove",
@@ -409,7 +557,8 @@ class ApplicationsTab(QWidget):
         
         if reply == QMessageBox.StandardButton.Yes:
             self.config.remove_shortcut(name)
-            self.refresh_shortcuts()
+            del self._shortcut_items[name]
+            self.shortcuts_list.takeItem(self.shortcuts_list.row(current_item))
     
     def run_shortcut(self):
         """Run selected shortcut"""
@@ -418,8 +567,7 @@ class ApplicationsTab(QWidget):
             QMessageBox.warning(self, "Warning", "Please select a shortcut to run")
             return
         
-        name = current_item.text().split(" -> ")[0]
-        path = self.config.get_shortcut(name)
+        _name, path = current_item.data(Qt.ItemDataRole.UserRole)
         
         if path:
             self.exe_edit.setText(path)
@@ -427,28 +575,145 @@ class ApplicationsTab(QWidget):
     
     def shortcut_double_clicked(self, item):
         """Handle double click on shortcut"""
-        name = item.text().split(" -> ")[0]
-        path = self.config.get_shortcut(name)
+        _name, path = item.data(Qt.ItemDataRole.UserRole)
         if path:
             self.exe_edit.setText(path)
     
     def refresh_shortcuts(self):
         """Refresh shortcuts list"""
         self.shortcuts_list.clear()
+        self._shortcut_items.clear()
         for name in self.config.list_shortcuts():
-            path = self.config.get_shortcut(name)
-            self.shortcuts_list.addItem(f"{name} -> {path}")
+            self._add_shortcut_item(name, self.config.get_shortcut(name))
+    
+    def _add_shortcut_item(self, name: str, path: str):
+        item = QListWidgetItem(f"{name} -> {path}")
+        item.setData(Qt.ItemDataRole.UserRole, (name, path))
+        self.shortcuts_list.addItem(item)
+        self._shortcut_items[name] = item
     
     def add_to_recent(self, path: str):
         """Add to recent applications"""
-        for i in range(self.recent_list.count()):
-            if self.recent_list.item(i).text() == path:
-                return
+        if path in self._recent_set:
+            return
         
-        self.recent_list.insertItem(0, path)
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_set.discard(self._recent.pop())
+            self.recent_list.takeItem(self.recent_list.count() - 1)
         
-        if self.recent_list.count() > 10:
-            self.recent_list.takeItem(10)
+        self._recent.appendleft(path)
+        self._recent_set.add(path)
+        self.recent_list.insertItem(0, path)
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """Table model of Wine processes, updated by PID diff"""
+    
+    HEADERS = ['PID', 'Name', 'Status', 'Start Time', 'Actions']
+    STATUS_COLUMN = 2
+    ACTIONS_COLUMN = 4
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        # PIDs sent SIGTERM since the last refresh
+        self._terminating = set()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        
+        pid, command, cpu, mem, start_time = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return pid
+        if column == 1:
+            return command[:50]
+        if column == 2:
+            if pid in self._terminating:
+                return "Terminating..."
+            return f"CPU: {cpu}% MEM: {mem}%"
+        if column == 3:
+            return start_time
+        return "Kill"
+    
+    def pid_at(self, row: int) -> str:
+        """Return the PID shown in row"""
+        return self._rows[row][0]
+    
+    def is_terminating(self, pid: str) -> bool:
+        return pid in self._terminating
+    
+    def mark_terminating(self, pid: str):
+        """Show pid as terminating until the next set_processes"""
+        for i, row in enumerate(self._rows):
+            if row[0] == pid:
+                self._terminating.add(pid)
+                index = self.index(i, self.STATUS_COLUMN)
+                self.dataChanged.emit(index, index)
+                return
+    
+    def set_processes(self, rows):
+        """Update the table to rows, touching only rows that changed"""
+        new_pids = {row[0] for row in rows}
+        # Anything still listed survived the signal; show it as running again
+        survivors = self._terminating & new_pids
+        self._terminating.clear()
+        
+        for i in range(len(self._rows) - 1, -1, -1):
+            if self._rows[i][0] not in new_pids:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self.endRemoveRows()
+        
+        positions = {row[0]: i for i, row in enumerate(self._rows)}
+        added = []
+        for row in rows:
+            i = positions.get(row[0])
+            if i is None:
+                added.append(row)
+            elif self._rows[i] != row or row[0] in survivors:
+                self._rows[i] = row
+                self.dataChanged.emit(self.index(i, 1), self.index(i, 3))
+        
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+
+
+class KillButtonDelegate(QStyledItemDelegate):
+    """Paints a button in the Actions column without a widget per row"""
+    
+    kill_clicked = pyqtSignal(int)
+    
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = index.data()
+        button.state = QStyle.StateFlag.State_Enabled
+        
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+    
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and option.rect.contains(event.position().toPoint())):
+            self.kill_clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class ProcessesTab(QWidget):
@@ -456,15 +721,29 @@ class ProcessesTab(QWidget):
     
     def __init__(self):
         super().__init__()
-        self.init_ui()
+        self._built = False
+    
+    def _ensure_built(self):
+        if not self._built:
+            self._built = True
+            self.init_ui()
     
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
         
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(5)
-        self.process_table.setHorizontalHeaderLabels(['PID', 'Name', 'Status', 'Start Time', 'Actions'])
+        self.process_model = ProcessTableModel(self)
+        self.kill_delegate = KillButtonDelegate(self)
+        self.kill_delegate.kill_clicked.connect(
+            lambda row: self.kill_process(self.process_model.pid_at(row))
+        )
+        
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
+        self.process_table.setItemDelegateForColumn(
+            ProcessTableModel.ACTIONS_COLUMN, self.kill_delegate
+        )
+        self.process_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.process_table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self.process_table)
         
@@ -479,7 +758,7 @@ class ProcessesTab(QWidget):
         button_layout.addWidget(kill_btn)
         
         killall_btn = QPushButton("Kill All Wine")
-        killall_btn.setStyleSheet("QPushButton { background-color: #f44336; color: white; }")
+        killall_btn.setObjectName("killAllBtn")
         killall_btn.clicked.connect(self.kill_all_wine)
         button_layout.addWidget(killall_btn)
         
@@ -488,54 +767,145 @@ class ProcessesTab(QWidget):
         
         self.setLayout(layout)
         
-        self.refresh_timer = QTimer()
+        # Only poll while the tab is on screen; see showEvent/hideEvent
+        self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.refresh_processes)
+    
+    def showEvent(self, event):
+        """Refresh immediately and resume polling when the tab is shown"""
+        self._ensure_built()
+        super().showEvent(event)
+        self.refresh_processes()
         self.refresh_timer.start(2000)
     
+    def hideEvent(self, event):
+        """Stop polling while another tab is active"""
+        if self._built:
+            self.refresh_timer.stop()
+        super().hideEvent(event)
+    
     def refresh_processes(self):
         """Refresh process list"""
-        import subprocess
-        
         try:
-            output = subprocess.check_output(['ps', 'aux'], universal_newlines=True)
-            wine_processes = [line for line in output.split('\n') if 'wine' in line.lower()]
+            wine_processes = self.list_wine_processes()
+        except (OSError, subprocess.SubprocessError):
+            return
+        
+        self.process_model.set_processes(wine_processes)
+    
+    def list_wine_processes(self):
+        """Return (pid, command, cpu, mem, start_time) rows for Wine processes"""
+        if psutil is None:
+            if _HAVE_PROC:
+                return self._list_wine_processes_proc()
+            return self._list_wine_processes_ps()
+        
+        rows = []
+        # process_iter reuses its Process objects between calls, so
+        # cpu_percent is measured since the previous refresh
+        for proc in psutil.process_iter(['name']):
+            name = proc.info['name'] or ''
+            argv0 = ''
+            if len(name) == _COMM_LEN:
+                try:
+                    argv0 = next(iter(proc.cmdline()), '')
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            if not _is_wine_process(name, argv0):
+                continue
+            
+            try:
+                with proc.oneshot():
+                    command = ' '.join(proc.cmdline()) or name
+                    cpu = proc.cpu_percent()
+                    mem = proc.memory_percent()
+                    start_time = _format_start_time(proc.create_time())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            rows.append((str(proc.pid), command, f"{cpu:.1f}", f"{mem:.1f}", start_time))
+        return rows
+    
+    def _list_wine_processes_proc(self):
+        """Fallback for list_wine_processes when psutil is not installed"""
+        # comm is the short executable name, so the filter is a prefix
+        # test on a few bytes per process rather than a scan of ps lines
+        pids = []
+        for entry in os.scandir('/proc'):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry.name}/comm') as f:
+                    name = f.read().rstrip('\n')
+                argv0 = ''
+                if len(name) == _COMM_LEN:
+                    with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                        argv0 = f.read().split(b'\0', 1)[0].decode(errors='replace')
+            except OSError:
+                continue
+            if _is_wine_process(name, argv0):
+                pids.append(entry.name)
+        
+        if not pids:
+            return []
+        
+        # ps only for the matches; it exits 1 if one has already gone.
+        # etimes (seconds since start) is always one token, unlike start,
+        # which becomes "Mmm dd" for processes older than a day
+        output = subprocess.run(
+            ['ps', '-o', 'pid=,pcpu=,pmem=,etimes=,args=', '-p', ','.join(pids)],
+            capture_output=True, text=True
+        ).stdout
+        
+        now = time.time()
+        rows = []
+        for line in output.splitlines():
+            parts = line.split(None, 4)
+            if len(parts) == 5 and parts[3].isdigit():
+                start_time = _format_start_time(now - int(parts[3]))
+                rows.append((parts[0], parts[4], parts[1], parts[2], start_time))
+        return rows
+    
+    def _list_wine_processes_ps(self):
+        """Fallback for systems without /proc"""
+        output = subprocess.check_output(
+            ['ps', '-A', '-o', 'pid=,pcpu=,pmem=,etime=,args='], universal_newlines=True
+        )
+        
+        now = time.time()
+        rows = []
+        for line in output.splitlines():
+            parts = line.split(None, 4)
+            if len(parts) != 5:
+                continue
             
-            self.process_table.setRowCount(len(wine_processes))
+            # Match on the program name, as comm is matched above
+            program = _program_name(parts[4].split(None, 1)[0])
+            if not _is_wine_process(program):
+                continue
             
-            for i, line in enumerate(wine_processes):
-                parts = line.split()
-                if len(parts) >= 11:
-                    pid = parts[1]
-                    cpu = parts[2]
-                    mem = parts[3]
-                    start_time = parts[8]
-                    command = ' '.join(parts[10:])
-                    
-                    self.process_table.setItem(i, 0, QTableWidgetItem(pid))
-                    self.process_table.setItem(i, 1, QTableWidgetItem(command[:50]))
-                    self.process_table.setItem(i, 2, QTableWidgetItem(f"CPU: {cpu}% MEM: {mem}%"))
-                    self.process_table.setItem(i, 3, QTableWidgetItem(start_time))
-                    
-                    kill_btn = QPushButton("Kill")
-                    kill_btn.clicked.connect(lambda checked, p=pid: self.kill_process(p))
-                    self.process_table.setCellWidget(i, 4, kill_btn)
-        except Exception as e:
-            pass
+            try:
+                start_time = _format_start_time(now - _etime_seconds(parts[3]))
+            except ValueError:
+                start_time = ''
+            rows.append((parts[0], parts[4], parts[1], parts[2], start_time))
+        return rows
     
     def kill_selected(self):
         """Kill selected process"""
-        current_row = self.process_table.currentRow()
+        current_row = self.process_table.currentIndex().row()
         if current_row >= 0:
-            pid_item = self.process_table.item(current_row, 0)
-            if pid_item:
-                self.kill_process(pid_item.text())
+            self.kill_process(self.process_model.pid_at(current_row))
     
     def kill_process(self, pid: str):
         """Kill process by PID"""
+        if self.process_model.is_terminating(pid):
+            return
+        
         try:
             os.kill(int(pid), 15)
+            # The next timer refresh drops the row or clears the marker
+            self.process_model.mark_terminating(pid)
             QMessageBox.information(self, "Success", f"Sent termination signal to process {pid}")
-            QTimer.singleShot(1000, self.refresh_processes)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to kill process: {str(e)}")
     
@@ -548,7 +918,6 @@ class ProcessesTab(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            import subprocess
             try:
                 subprocess.run(['killall', 'wine', 'wineserver', 'wine64'], check=False)
                 QMessageBox.information(self, "Success", "Terminated all Wine processes")
@@ -6,13 +6,29 @@ Works without Qt platform plugins
 
 import sys
 import os
+import stat
 import subprocess
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import queue
+import selectors
+import shlex
 import configparser
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# fcntl.F_SETPIPE_SZ is only exposed from Python 3.10
+_F_SETPIPE_SZ = getattr(fcntl, 'F_SETPIPE_SZ', 1031)
+_PIPE_SIZE = 1 << 20
+
+# Oldest lines are dropped beyond this so the Text widget stays fast
+_MAX_LOG_LINES = 5000
+
 
 class WineAppGUI:
     def __init__(self, root):
@@ -23,6 +39,11 @@ class WineAppGUI:
         # Configuration
         self.config_dir = os.path.join(Path.home(), '.config', 'wineapp')
         os.makedirs(self.config_dir, exist_ok=True)
+        self.config_file = os.path.join(self.config_dir, 'wine.conf')
+        
+        # Kept for the session; save_config edits it in place, which also
+        # preserves keys written by the Qt GUI that this window doesn't show
+        self._parser = configparser.ConfigParser()
         
         self.config = {
             'wine_prefix': os.path.join(Path.home(), '.wine'),
@@ -32,10 +53,22 @@ class WineAppGUI:
         
         self.load_config()
         
+        # wine-cli lives next to this script; the path never changes
+        self._cli_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bin', 'wine-cli')
+        self._cli_exists = os.path.exists(self._cli_path)
+        
+        # Snapshot of the environment; launches only add WINEPREFIX
+        self._base_env = os.environ.copy()
+        
+        # Worker threads must not touch Tk; they queue log lines instead
+        self.log_queue = queue.Queue()
+        
         # Create UI
         self.create_menu()
         self.create_widgets()
         
+        self.root.after(50, self._drain_log_queue)
+        
     def create_menu(self):
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
@@ -68,7 +101,7 @@ class WineAppGUI:
         
         # Title
         title = ttk.Label(main_frame, text="Wine Application Manager", 
-                         font=('Arial', 16, 'bold'))
+                         style='Title.TLabel')
         title.grid(row=0, column=0, pady=10)
         
         # Run executable section
@@ -149,35 +182,49 @@ class WineAppGUI:
             messagebox.showwarning("Warning", "Please select an executable file")
             return
         
-        if not os.path.exists(exe_path):
+        # One stat on the UI thread; also rejects directories
+        try:
+            st = os.stat(exe_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             messagebox.showerror("Error", f"File not found: {exe_path}")
             return
         
-        args = self.args_entry.get().split() if self.args_entry.get() else []
+        # Honour quoting, e.g. paths with spaces
+        try:
+            args = shlex.split(self.args_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid arguments: {e}")
+            return
         
         self.log(f"Running: {exe_path}")
         
+        # Read the entries here: the worker thread must not call into Tk
+        prefix = self.prefix_entry.get()
+        binary = self.binary_entry.get()
+        
         # Run in background thread
-        thread = threading.Thread(target=self._execute_wine, args=(exe_path, args))
+        thread = threading.Thread(target=self._execute_wine,
+                                  args=(exe_path, args, prefix, binary))
         thread.daemon = True
         thread.start()
     
-    def _execute_wine(self, exe_path, args):
+    def _execute_wine(self, exe_path, args, prefix, binary):
         try:
-            # Get the directory where this script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            cli_path = os.path.join(script_dir, 'bin', 'wine-cli')
+            # Only re-check while missing, in case it gets built meanwhile
+            if not self._cli_exists:
+                self._cli_exists = os.path.exists(self._cli_path)
             
-            # Check if wine-cli exists
-            if os.path.exists(cli_path):
+            env = None
+            if self._cli_exists:
                 # Use our wine-cli for better integration
-                cmd = [cli_path, '-p', self.prefix_entry.get(), 'run', exe_path] + args
+                cmd = [self._cli_path, '-p', prefix, 'run', exe_path] + args
                 self.log(f"Using wine-cli: {exe_path}")
             else:
                 # Fallback to direct wine execution
-                env = os.environ.copy()
-                env['WINEPREFIX'] = self.prefix_entry.get()
-                cmd = [self.binary_entry.get(), exe_path] + args
+                env = {**self._base_env, 'WINEPREFIX': prefix}
+                cmd = [binary, exe_path] + args
                 self.log(f"Using direct wine: {exe_path}")
             
             self.log(f"Command: {' '.join(cmd)}")
@@ -186,16 +233,35 @@ class WineAppGUI:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                env=env,
+                bufsize=0
             )
             
+            self._grow_pipe(process.stdout)
+            
             self.log(f"Process started with PID: {process.pid}")
             
-            # Read output in real-time
-            for line in process.stdout:
-                if line.strip():
-                    self.log(line.strip())
+            # Read output in real-time straight from the pipe fd, up to
+            # 64 KiB per wakeup; a partial last line is carried over to
+            # the next chunk. EOF also reports readable, with b''.
+            fd = process.stdout.fileno()
+            residual = b''
+            with selectors.DefaultSelector() as sel:
+                sel.register(fd, selectors.EVENT_READ)
+                while True:
+                    sel.select()
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    lines = (residual + chunk).split(b'\n')
+                    residual = lines.pop()
+                    for raw in lines:
+                        line = raw.decode(errors='replace').strip()
+                        if line:
+                            self.log(line)
+            
+            if residual.strip():
+                self.log(residual.decode(errors='replace').strip())
             
             process.wait()
             self.log(f"Process exited with code: {process.returncode}")
@@ -210,44 +276,77 @@ class WineAppGUI:
             import traceback
             self.log(traceback.format_exc())
     
+    @staticmethod
+    def _grow_pipe(pipe):
+        """Enlarge a pipe to 1 MiB so Wine log bursts don't block the child"""
+        if fcntl is None:
+            return
+        try:
+            fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, _PIPE_SIZE)
+        except OSError:
+            # Not Linux, or above /proc/sys/fs/pipe-max-size
+            pass
+    
     def run_tool(self, tool):
-        env = os.environ.copy()
-        env['WINEPREFIX'] = self.prefix_entry.get()
+        prefix = self.prefix_entry.get()
+        binary = self.binary_entry.get()
+        env = {**self._base_env, 'WINEPREFIX': prefix}
         
         try:
-            subprocess.Popen([self.binary_entry.get(), tool], env=env)
+            subprocess.Popen([binary, tool], env=env)
             self.log(f"Launched: {tool}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to run {tool}: {str(e)}")
     
     def log(self, message):
+        if threading.current_thread() is not threading.main_thread():
+            self.log_queue.put(message)
+            return
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
-        self.log_text.update()
+    
+    def _drain_log_queue(self):
+        """Write queued worker messages to the log, then reschedule"""
+        batch = []
+        for _ in range(500):
+            try:
+                batch.append(self.log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            # One insert and one scroll per tick; Tk repaints between ticks
+            self.log_text.insert(tk.END, "\n".join(batch) + "\n")
+            lines = int(self.log_text.index('end-1c').split('.')[0])
+            if lines > _MAX_LOG_LINES:
+                self.log_text.delete('1.0', f'{lines - _MAX_LOG_LINES}.0')
+            self.log_text.see(tk.END)
+        self.root.after(50, self._drain_log_queue)
     
     def clear_log(self):
         self.log_text.delete(1.0, tk.END)
     
     def load_config(self):
-        config_file = os.path.join(self.config_dir, 'wine.conf')
-        if os.path.exists(config_file):
-            parser = configparser.ConfigParser()
-            parser.read(config_file)
-            if 'Wine' in parser:
-                for key in self.config:
-                    if key in parser['Wine']:
-                        self.config[key] = parser['Wine'][key]
+        self._parser.read(self.config_file)
+        if 'Wine' in self._parser:
+            for key in self.config:
+                if key in self._parser['Wine']:
+                    self.config[key] = self._parser['Wine'][key]
     
     def save_config(self):
-        self.config['wine_prefix'] = self.prefix_entry.get()
-        self.config['wine_binary'] = self.binary_entry.get()
-        
-        config_file = os.path.join(self.config_dir, 'wine.conf')
-        parser = configparser.ConfigParser()
-        parser['Wine'] = self.config
+        prefix = self.prefix_entry.get()
+        binary = self.binary_entry.get()
         
-        with open(config_file, 'w') as f:
-            parser.write(f)
+        if (prefix != self.config['wine_prefix'] or binary != self.config['wine_binary']
+                or 'Wine' not in self._parser):
+            self.config['wine_prefix'] = prefix
+            self.config['wine_binary'] = binary
+            
+            if 'Wine' not in self._parser:
+                self._parser['Wine'] = {}
+            self._parser['Wine'].update(self.config)
+            
+            with open(self.config_file, 'w') as f:
+                self._parser.write(f)
         
         messagebox.showinfo("Success", "Configuration saved")
         self.log("Configuration saved")
@@ -274,6 +373,8 @@ def main():
         style.theme_use('clam')
     except:
         pass
+    # Configured once here; widgets refer to it by style name
+    style.configure('Title.TLabel', font=('Arial', 16, 'bold'))
     
     app = WineAppGUI(root)
     root.mainloop()
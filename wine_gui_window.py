@@ -5,21 +5,159 @@ Wine Application Manager - Main Window Implementation
 
 import sys
 import os
+from datetime import datetime
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QTextEdit, QTabWidget, QMessageBox,
+    QPushButton, QLabel, QTextEdit, QPlainTextEdit, QTabWidget, QMessageBox, QListView,
+    QFileDialog, QGroupBox, QGridLayout,
     QMenuBar, QMenu, QToolBar, QStatusBar, QSystemTrayIcon, QStyle
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QIcon, QAction, QTextCursor
+from PyQt6.QtCore import (
+    Qt, QTimer, QStringListModel, QProcess, QSaveFile, QIODevice
+)
+from PyQt6.QtGui import QIcon, QAction, QTextCursor, QTextCharFormat, QColor
 
 from wine_gui import (
-    WineConfig, ProcessMonitorThread, WineExecutorThread,
-    PrefixManagerDialog
+    WineConfig, ProcessMonitorThread, WineExecutor,
+    PrefixManagerDialog, DirSizeThread, CleanupThread
+)
+from wine_gui_main import ConfigurationTab, ApplicationsTab, ProcessesTab, TAB_QSS
+
+
+# `wine --version` output, queried once by the first ToolsTab refresh
+_wine_version = None
+
+# Winetricks verbs offered in WinetricksTab
+_COMMON_ITEMS = (
+    'dotnet40', 'dotnet45', 'dotnet46', 'dotnet48',
+    'vcrun2005', 'vcrun2008', 'vcrun2010', 'vcrun2012', 'vcrun2013', 'vcrun2015',
+    'd3dx9', 'd3dx10', 'd3dx11_43', 'd3dcompiler_43', 'd3dcompiler_47',
+    'dxvk', 'vkd3d', 'quartz', 'devenum', 'wmp10',
+    'msxml3', 'msxml4', 'msxml6', 'xact', 'xna31', 'xna40',
+    'physx', 'vcrun6', 'mfc42', 'gdiplus', 'corefonts'
+)
+
+_FONT_ITEMS = (
+    'corefonts', 'tahoma', 'liberation', 'lucida', 'consolas',
+    'courier', 'times', 'arial', 'georgia', 'impact', 'trebuchet'
+)
+
+# Winetricks status label colours, selected by its "state" property
+WINETRICKS_QSS = """
+    QLabel#statusLabel {
+        font-weight: bold;
+    }
+    QLabel#statusLabel[state="ok"] {
+        color: #4CAF50;
+    }
+    QLabel#statusLabel[state="busy"] {
+        color: #FF9800;
+    }
+    QLabel#statusLabel[state="err"] {
+        color: #f44336;
+    }
+"""
+
+# Application theme, set once on the QApplication in main()
+_MAIN_QSS = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QTabWidget::pane {
+        border: 1px solid #ddd;
+        background-color: white;
+    }
+    QTabBar::tab {
+        background-color: #e0e0e0;
+        padding: 8px 16px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: white;
+        border-bottom: 2px solid #2196F3;
+    }
+    QPushButton {
+        padding: 6px 12px;
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        border-radius: 3px;
+    }
+    QPushButton:hover {
+        background-color: #1976D2;
+    }
+    QPushButton:pressed {
+        background-color: #0D47A1;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+""" + TAB_QSS + WINETRICKS_QSS
+
+
+# Buttons of the Wine Tools group, laid out two per row
+_WINE_TOOLS = (
+    ("Wine Configuration (winecfg)", ('winecfg',)),
+    ("Registry Editor (regedit)", ('wine', 'regedit')),
+    ("Task Manager (taskmgr)", ('wine', 'taskmgr')),
+    ("File Explorer (explorer)", ('wine', 'explorer')),
+    ("Command Prompt (cmd)", ('wine', 'cmd')),
+    ("Notepad", ('wine', 'notepad')),
 )
-from wine_gui_main import ConfigurationTab, ApplicationsTab, ProcessesTab
+
+
+def _spawn(parent: QWidget, config: WineConfig, argv, *, wait: bool = False,
+           success_msg: str = None, failure_msg: str = None):
+    """Run a Wine command in the configured prefix
+    
+    By default the command is started detached, so nothing has to wait
+    for it. With wait=True it runs as a child of parent and the outcome
+    is reported when it finishes: success_msg on a zero exit (if given),
+    failure_msg otherwise.
+    """
+    program, args = argv[0], list(argv[1:])
+    failure_msg = failure_msg or f"Failed to run {' '.join(argv)}"
+    
+    if not wait:
+        process = QProcess()
+        process.setProgram(program)
+        process.setArguments(args)
+        process.setProcessEnvironment(config.prefix_qprocess_env())
+        started, _pid = process.startDetached()
+        if not started:
+            QMessageBox.critical(parent, "Error", f"{failure_msg}: {process.errorString()}")
+        return
+    
+    process = QProcess(parent)
+    process.setProcessEnvironment(config.prefix_qprocess_env())
+    
+    def failed(error):
+        if error == QProcess.ProcessError.FailedToStart:
+            QMessageBox.critical(parent, "Error", f"{failure_msg}: {process.errorString()}")
+            process.deleteLater()
+    
+    def finished(exit_code, exit_status):
+        process.deleteLater()
+        if exit_status == QProcess.ExitStatus.NormalExit and exit_code == 0:
+            if success_msg:
+                QMessageBox.information(parent, "Success", success_msg)
+        else:
+            QMessageBox.critical(parent, "Error", f"{failure_msg}: {program} exited with code {exit_code}")
+    
+    process.errorOccurred.connect(failed)
+    process.finished.connect(finished)
+    process.start(program, args)
 
 
 class LogTab(QWidget):
@@ -27,15 +165,30 @@ class LogTab(QWidget):
     
     def __init__(self):
         super().__init__()
+        
+        # Entries are queued on append and inserted together every 50ms
+        self._pending = []
+        # One char format per colour, built on first use
+        self._formats = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush)
+        
         self.init_ui()
     
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        # Plain text with coloured char-format runs, so entries skip
+        # the HTML parser entirely
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("QTextEdit { font-family: monospace; background-color: #1e1e1e; color: #d4d4d4; }")
+        self.log_text.setUndoRedoEnabled(False)
+        # One block per line; the oldest are dropped past 5000
+        self.log_text.setMaximumBlockCount(5000)
+        self.log_text.setStyleSheet("QPlainTextEdit { font-family: monospace; background-color: #1e1e1e; color: #d4d4d4; }")
         layout.addWidget(self.log_text)
         
         button_layout = QHBoxLayout()
@@ -55,35 +208,74 @@ class LogTab(QWidget):
     
     def append_log(self, message: str, color: str = "#d4d4d4"):
         """Append message to log"""
-        cursor = self.log_text.textCursor()
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._pending.append((timestamp, color, message))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush(self):
+        """Insert all pending entries with a single document edit"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
         cursor.movePosition(QTextCursor.MoveOperation.End)
         
-        timestamp = os.popen('date "+%Y-%m-%d %H:%M:%S"').read().strip()
-        formatted_message = f'<span style="color: #888;">[{timestamp}]</span> <span style="color: {color};">{message}</span>'
+        # The edit block defers relayout to the end
+        cursor.beginEditBlock()
+        first = document.isEmpty()
+        ts_format = self._format("#888")
+        for timestamp, color, message in self._pending:
+            if not first:
+                cursor.insertBlock()
+            first = False
+            cursor.insertText(f"[{timestamp}] ", ts_format)
+            cursor.insertText(message, self._format(color))
+        cursor.endEditBlock()
+        self._pending.clear()
         
-        cursor.insertHtml(formatted_message + "<br>")
         self.log_text.setTextCursor(cursor)
         self.log_text.ensureCursorVisible()
     
+    def _format(self, color: str) -> QTextCharFormat:
+        """Return the cached char format for a colour"""
+        fmt = self._formats.get(color)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[color] = fmt
+        return fmt
+    
     def clear_log(self):
         """Clear log"""
+        self._flush_timer.stop()
+        self._pending.clear()
         self.log_text.clear()
     
     def save_log(self):
         """Save log to file"""
-        from PyQt6.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Save Log File", "", "Log Files (*.log);;Text Files (*.txt);;All Files (*)"
         )
         
         if file_path:
-            try:
-                with open(file_path, 'w') as f:
-                    f.write(self.log_text.toPlainText())
-                QMessageBox.information(self, "Success", "Log saved successfully")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save log: {str(e)}")
+            self._flush()
+            
+            # Written block by block rather than through one toPlainText()
+            # copy; QSaveFile replaces the target only once it is complete
+            out = QSaveFile(file_path)
+            if out.open(QIODevice.OpenModeFlag.WriteOnly):
+                block = self.log_text.document().begin()
+                while block.isValid():
+                    out.write((block.text() + '\n').encode('utf-8'))
+                    block = block.next()
+                if out.commit():
+                    QMessageBox.information(self, "Success", "Log saved successfully")
+                    return
+            
+            QMessageBox.critical(self, "Error", f"Failed to save log: {out.errorString()}")
 
 
 class WinetricksTab(QWidget):
@@ -92,7 +284,18 @@ class WinetricksTab(QWidget):
     def __init__(self, config: WineConfig):
         super().__init__()
         self.config = config
-        self.init_ui()
+        self.install_process = None
+        self._built = False
+    
+    def showEvent(self, event):
+        """Build the widgets the first time the tab is shown"""
+        self._ensure_built()
+        super().showEvent(event)
+    
+    def _ensure_built(self):
+        if not self._built:
+            self._built = True
+            self.init_ui()
     
     def init_ui(self):
         """Initialize UI"""
@@ -102,23 +305,13 @@ class WinetricksTab(QWidget):
         info_label.setStyleSheet("QLabel { color: #666; margin-bottom: 10px; }")
         layout.addWidget(info_label)
         
-        from PyQt6.QtWidgets import QListWidget
-        
         categories_layout = QHBoxLayout()
         
         left_layout = QVBoxLayout()
         left_layout.addWidget(QLabel("Common Components:"))
         
-        self.common_list = QListWidget()
-        common_items = [
-            'dotnet40', 'dotnet45', 'dotnet46', 'dotnet48',
-            'vcrun2005', 'vcrun2008', 'vcrun2010', 'vcrun2012', 'vcrun2013', 'vcrun2015',
-            'd3dx9', 'd3dx10', 'd3dx11_43', 'd3dcompiler_43', 'd3dcompiler_47',
-            'dxvk', 'vkd3d', 'quartz', 'devenum', 'wmp10',
-            'msxml3', 'msxml4', 'msxml6', 'xact', 'xna31', 'xna40',
-            'physx', 'vcrun6', 'mfc42', 'gdiplus', 'corefonts'
-        ]
-        self.common_list.addItems(common_items)
+        self.common_list = QListView()
+        self.common_list.setModel(QStringListModel(list(_COMMON_ITEMS), self.common_list))
         left_layout.addWidget(self.common_list)
         
         categories_layout.addLayout(left_layout)
@@ -126,12 +319,8 @@ class WinetricksTab(QWidget):
         right_layout = QVBoxLayout()
         right_layout.addWidget(QLabel("Fonts:"))
         
-        self.fonts_list = QListWidget()
-        font_items = [
-            'corefonts', 'tahoma', 'liberation', 'lucida', 'consolas',
-            'courier', 'times', 'arial', 'georgia', 'impact', 'trebuchet'
-        ]
-        self.fonts_list.addItems(font_items)
+        self.fonts_list = QListView()
+        self.fonts_list.setModel(QStringListModel(list(_FONT_ITEMS), self.fonts_list))
         right_layout.addWidget(self.fonts_list)
         
         categories_layout.addLayout(right_layout)
@@ -152,20 +341,30 @@ class WinetricksTab(QWidget):
         layout.addLayout(button_layout)
         
         status_label = QLabel("Status: Ready")
-        status_label.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
+        status_label.setObjectName("statusLabel")
+        status_label.setProperty("state", "ok")
         layout.addWidget(status_label)
         self.status_label = status_label
         
         self.setLayout(layout)
     
-    def install_selected(self, list_widget):
+    def set_status(self, text: str, state: str):
+        """Update the status label; state is 'ok', 'busy' or 'err'"""
+        self.status_label.setText(text)
+        if self.status_label.property("state") != state:
+            # Colours come from WINETRICKS_QSS; re-polish to apply them
+            self.status_label.setProperty("state", state)
+            self.status_label.style().unpolish(self.status_label)
+            self.status_label.style().polish(self.status_label)
+    
+    def install_selected(self, list_view):
         """Install selected component"""
-        current_item = list_widget.currentItem()
-        if not current_item:
+        current_index = list_view.currentIndex()
+        if not current_index.isValid():
             QMessageBox.warning(self, "Warning", "Please select a component to install")
             return
         
-        component = current_item.text()
+        component = current_index.data()
         
         reply = QMessageBox.question(
             self, "Confirm Installation",
@@ -178,36 +377,46 @@ class WinetricksTab(QWidget):
     
     def install_component(self, component: str):
         """Install winetricks component"""
-        self.status_label.setText(f"Status: Installing {component}...")
-        self.status_label.setStyleSheet("QLabel { color: #FF9800; font-weight: bold; }")
+        if self.install_process is not None:
+            QMessageBox.warning(self, "Warning", "Another component is still being installed")
+            return
         
-        import subprocess
+        self.set_status(f"Status: Installing {component}...", "busy")
         
-        try:
-            env = os.environ.copy()
-            env['WINEPREFIX'] = self.config.config['wine_prefix']
-            
-            process = subprocess.Popen(
-                ['winetricks', '-q', component],
-                env=env,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            process.wait()
-            
-            if process.returncode == 0:
-                self.status_label.setText(f"Status: {component} installed successfully")
-                self.status_label.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
-                QMessageBox.information(self, "Success", f"{component} installed successfully")
-            else:
-                self.status_label.setText(f"Status: Failed to install {component}")
-                self.status_label.setStyleSheet("QLabel { color: #f44336; font-weight: bold; }")
-                QMessageBox.critical(self, "Error", f"Failed to install {component}")
-        except Exception as e:
-            self.status_label.setText(f"Status: Error - {str(e)}")
-            self.status_label.setStyleSheet("QLabel { color: #f44336; font-weight: bold; }")
-            QMessageBox.critical(self, "Error", f"Installation error: {str(e)}")
+        # winetricks output isn't shown; don't let QProcess buffer it
+        self.install_process = QProcess(self)
+        self.install_process.setProcessEnvironment(self.config.prefix_qprocess_env())
+        self.install_process.setStandardOutputFile(QProcess.nullDevice())
+        self.install_process.setStandardErrorFile(QProcess.nullDevice())
+        self.install_process.finished.connect(
+            lambda exit_code, _: self._install_finished(component, exit_code)
+        )
+        self.install_process.errorOccurred.connect(self._install_failed)
+        self.install_process.start('winetricks', ['-q', component])
+    
+    def _install_failed(self, error):
+        """Handle winetricks failing to start"""
+        if error != QProcess.ProcessError.FailedToStart:
+            return
+        
+        message = self.install_process.errorString()
+        self.install_process.deleteLater()
+        self.install_process = None
+        
+        self.set_status(f"Status: Error - {message}", "err")
+        QMessageBox.critical(self, "Error", f"Installation error: {message}")
+    
+    def _install_finished(self, component: str, exit_code: int):
+        """Handle winetricks completion"""
+        self.install_process.deleteLater()
+        self.install_process = None
+        
+        if exit_code == 0:
+            self.set_status(f"Status: {component} installed successfully", "ok")
+            QMessageBox.information(self, "Success", f"{component} installed successfully")
+        else:
+            self.set_status(f"Status: Failed to install {component}", "err")
+            QMessageBox.critical(self, "Error", f"Failed to install {component}")
 
 
 class ToolsTab(QWidget):
@@ -216,40 +425,34 @@ class ToolsTab(QWidget):
     def __init__(self, config: WineConfig):
         super().__init__()
         self.config = config
-        self.init_ui()
+        self.size_thread = None
+        self.cleanup_thread = None
+        self._info = []
+        self._size_line = None
+        self.version_process = None
+        self._built = False
+    
+    def showEvent(self, event):
+        """Build the widgets the first time the tab is shown"""
+        self._ensure_built()
+        super().showEvent(event)
+    
+    def _ensure_built(self):
+        if not self._built:
+            self._built = True
+            self.init_ui()
     
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
         
-        from PyQt6.QtWidgets import QGroupBox, QGridLayout
-        
         wine_tools_group = QGroupBox("Wine Tools")
         wine_tools_layout = QGridLayout()
         
-        winecfg_btn = QPushButton("Wine Configuration (winecfg)")
-        winecfg_btn.clicked.connect(lambda: self.run_tool('winecfg'))
-        wine_tools_layout.addWidget(winecfg_btn, 0, 0)
-        
-        regedit_btn = QPushButton("Registry Editor (regedit)")
-        regedit_btn.clicked.connect(lambda: self.run_tool('wine', 'regedit'))
-        wine_tools_layout.addWidget(regedit_btn, 0, 1)
-        
-        taskmgr_btn = QPushButton("Task Manager (taskmgr)")
-        taskmgr_btn.clicked.connect(lambda: self.run_tool('wine', 'taskmgr'))
-        wine_tools_layout.addWidget(taskmgr_btn, 1, 0)
-        
-        explorer_btn = QPushButton("File Explorer (explorer)")
-        explorer_btn.clicked.connect(lambda: self.run_tool('wine', 'explorer'))
-        wine_tools_layout.addWidget(explorer_btn, 1, 1)
-        
-        cmd_btn = QPushButton("Command Prompt (cmd)")
-        cmd_btn.clicked.connect(lambda: self.run_tool('wine', 'cmd'))
-        wine_tools_layout.addWidget(cmd_btn, 2, 0)
-        
-        notepad_btn = QPushButton("Notepad")
-        notepad_btn.clicked.connect(lambda: self.run_tool('wine', 'notepad'))
-        wine_tools_layout.addWidget(notepad_btn, 2, 1)
+        for i, (label, argv) in enumerate(_WINE_TOOLS):
+            btn = QPushButton(label)
+            btn.clicked.connect(lambda checked=False, argv=argv: self.run_tool(*argv))
+            wine_tools_layout.addWidget(btn, i // 2, i % 2)
         
         wine_tools_group.setLayout(wine_tools_layout)
         layout.addWidget(wine_tools_group)
@@ -265,14 +468,18 @@ class ToolsTab(QWidget):
         kill_wine_btn.clicked.connect(self.kill_wineserver)
         maintenance_layout.addWidget(kill_wine_btn, 0, 1)
         
-        cleanup_btn = QPushButton("Clean Temp Files")
-        cleanup_btn.clicked.connect(self.cleanup_temp)
-        maintenance_layout.addWidget(cleanup_btn, 1, 0)
+        self.cleanup_btn = QPushButton("Clean Temp Files")
+        self.cleanup_btn.clicked.connect(self.cleanup_temp)
+        maintenance_layout.addWidget(self.cleanup_btn, 1, 0)
         
         uninstaller_btn = QPushButton("Uninstall Programs")
         uninstaller_btn.clicked.connect(lambda: self.run_tool('wine', 'uninstaller'))
         maintenance_layout.addWidget(uninstaller_btn, 1, 1)
         
+        self.cleanup_label = QLabel()
+        self.cleanup_label.hide()
+        maintenance_layout.addWidget(self.cleanup_label, 2, 0, 1, 2)
+        
         maintenance_group.setLayout(maintenance_layout)
         layout.addWidget(maintenance_group)
         
@@ -296,47 +503,26 @@ class ToolsTab(QWidget):
         self.setLayout(layout)
         self.refresh_info()
     
-    def run_tool(self, *args):
+    def run_tool(self, *argv):
         """Run Wine tool"""
-        import subprocess
-        
-        env = os.environ.copy()
-        env['WINEPREFIX'] = self.config.config['wine_prefix']
-        
-        try:
-            subprocess.Popen(list(args), env=env)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to run tool: {str(e)}")
+        _spawn(self, self.config, argv)
     
     def run_wineboot_update(self):
         """Run wineboot to update prefix"""
-        import subprocess
-        
-        env = os.environ.copy()
-        env['WINEPREFIX'] = self.config.config['wine_prefix']
-        
-        try:
-            subprocess.run(['wineboot', '-u'], env=env, check=True)
-            QMessageBox.information(self, "Success", "Wine prefix updated successfully")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to update prefix: {str(e)}")
+        _spawn(self, self.config, ('wineboot', '-u'), wait=True,
+               success_msg="Wine prefix updated successfully",
+               failure_msg="Failed to update prefix")
     
     def kill_wineserver(self):
         """Kill wineserver"""
-        import subprocess
-        
-        env = os.environ.copy()
-        env['WINEPREFIX'] = self.config.config['wine_prefix']
-        
-        try:
-            subprocess.run(['wineserver', '-k'], env=env, check=True)
-            QMessageBox.information(self, "Success", "Wine server terminated")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to kill wineserver: {str(e)}")
+        _spawn(self, self.config, ('wineserver', '-k'), wait=True,
+               success_msg="Wine server terminated",
+               failure_msg="Failed to kill wineserver")
     
     def cleanup_temp(self):
         """Clean temporary files"""
-        import shutil
+        if self.cleanup_thread is not None and self.cleanup_thread.isRunning():
+            return
         
         prefix = self.config.config['wine_prefix']
         temp_dirs = [
@@ -345,53 +531,100 @@ class ToolsTab(QWidget):
             os.path.join(prefix, 'drive_c', 'windows', 'Installer')
         ]
         
-        cleaned = 0
-        for temp_dir in temp_dirs:
-            if os.path.exists(temp_dir):
-                for item in os.listdir(temp_dir):
-                    item_path = os.path.join(temp_dir, item)
-                    try:
-                        if os.path.isfile(item_path):
-                            os.unlink(item_path)
-                            cleaned += 1
-                        elif os.path.isdir(item_path):
-                            shutil.rmtree(item_path)
-                            cleaned += 1
-                    except Exception:
-                        pass
+        self.cleanup_btn.setEnabled(False)
+        self.cleanup_label.setText("Cleaning temp files...")
+        self.cleanup_label.show()
         
+        self.cleanup_thread = CleanupThread(temp_dirs)
+        self.cleanup_thread.progress.connect(
+            lambda cleaned: self.cleanup_label.setText(f"Cleaning temp files... {cleaned} removed")
+        )
+        self.cleanup_thread.done.connect(self._cleanup_done)
+        self.cleanup_thread.start()
+    
+    def _cleanup_done(self, cleaned: int):
+        self.cleanup_label.hide()
+        self.cleanup_btn.setEnabled(True)
         QMessageBox.information(self, "Success", f"Cleaned {cleaned} temporary items")
     
     def refresh_info(self):
         """Refresh system information"""
-        import subprocess
-        
         info = []
         
-        try:
-            wine_version = subprocess.check_output(['wine', '--version'], universal_newlines=True).strip()
-            info.append(f"Wine Version: {wine_version}")
-        except:
-            info.append("Wine Version: Not found")
+        # Line 0; filled in by _version_ready on the first refresh
+        info.append(f"Wine Version: {_wine_version or 'checking...'}")
+        if _wine_version is None:
+            self._query_wine_version()
         
-        info.append(f"Wine Prefix: {self.config.config['wine_prefix']}")
+        prefix = self.config.config['wine_prefix']
+        info.append(f"Wine Prefix: {prefix}")
         info.append(f"Architecture: {self.config.config['architecture']}")
         
-        if os.path.exists(self.config.config['wine_prefix']):
-            size = self.get_directory_size(self.config.config['wine_prefix'])
-            info.append(f"Prefix Size: {size / (1024*1024):.2f} MB")
+        self._size_line = None
+        if os.path.exists(prefix):
+            # Filled in by _size_ready once the walk finishes
+            self._size_line = len(info)
+            info.append("Prefix Size: calculating...")
+            self.start_size_thread(prefix)
         
+        self._info = info
         self.info_text.setPlainText('\n'.join(info))
     
-    def get_directory_size(self, path):
-        """Get directory size"""
-        total = 0
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.exists(filepath):
-                    total += os.path.getsize(filepath)
-        return total
+    def _query_wine_version(self):
+        """Run wine --version once per program lifetime, without blocking"""
+        if self.version_process is not None:
+            return
+        
+        self.version_process = QProcess(self)
+        self.version_process.finished.connect(
+            lambda exit_code, _: self._version_ready(exit_code)
+        )
+        self.version_process.errorOccurred.connect(self._version_failed)
+        self.version_process.start('wine', ['--version'])
+    
+    def _version_failed(self, error):
+        """Handle wine not being installed"""
+        if error == QProcess.ProcessError.FailedToStart:
+            self._version_ready(-1)
+    
+    def _version_ready(self, exit_code: int):
+        global _wine_version
+        
+        output = ''
+        if exit_code == 0:
+            output = bytes(self.version_process.readAllStandardOutput()).decode(errors='replace').strip()
+        _wine_version = output or "Not found"
+        
+        self.version_process.deleteLater()
+        self.version_process = None
+        
+        self._info[0] = f"Wine Version: {_wine_version}"
+        self.info_text.setPlainText('\n'.join(self._info))
+    
+    def start_size_thread(self, path: str):
+        """Compute the prefix size off the UI thread"""
+        if self.size_thread is not None and self.size_thread.isRunning():
+            self.size_thread.size_ready.disconnect()
+            self.size_thread.requestInterruption()
+            self.size_thread.wait()
+        
+        self.size_thread = DirSizeThread(path)
+        self.size_thread.size_ready.connect(self._size_ready)
+        self.size_thread.start()
+    
+    def stop_threads(self):
+        """Abandon a running size calculation and wait for any cleanup"""
+        if self.size_thread is not None and self.size_thread.isRunning():
+            self.size_thread.requestInterruption()
+            self.size_thread.wait()
+        if self.cleanup_thread is not None:
+            self.cleanup_thread.wait()
+    
+    def _size_ready(self, size: int):
+        if self._size_line is None:
+            return
+        self._info[self._size_line] = f"Prefix Size: {size / (1024*1024):.2f} MB"
+        self.info_text.setPlainText('\n'.join(self._info))
 
 
 class WineApplicationWindow(QMainWindow):
@@ -401,7 +634,7 @@ class WineApplicationWindow(QMainWindow):
         super().__init__()
         self.config = WineConfig()
         self.process_monitor = ProcessMonitorThread()
-        self.executor_thread = None
+        self.executor = None
         self.init_ui()
         self.setup_connections()
     
@@ -442,8 +675,6 @@ class WineApplicationWindow(QMainWindow):
         layout.addWidget(self.tabs)
         
         central_widget.setLayout(layout)
-        
-        self.apply_theme()
     
     def create_menu_bar(self):
         """Create menu bar"""
@@ -503,7 +734,6 @@ class WineApplicationWindow(QMainWindow):
     
     def setup_connections(self):
         """Setup signal connections"""
-        self.process_monitor.process_update.connect(self.on_process_update)
         self.process_monitor.process_finished.connect(self.on_process_finished)
         self.process_monitor.start()
     
@@ -512,12 +742,13 @@ class WineApplicationWindow(QMainWindow):
         self.log_tab.append_log(f"Starting: {exe_path}", "#4CAF50")
         self.statusBar().showMessage(f"Running: {os.path.basename(exe_path)}")
         
-        self.executor_thread = WineExecutorThread(exe_path, args, self.config.config)
-        self.executor_thread.output_ready.connect(self.on_output_ready)
-        self.executor_thread.error_ready.connect(self.on_error_ready)
-        self.executor_thread.process_started.connect(self.on_process_started)
-        self.executor_thread.process_finished.connect(self.on_executor_finished)
-        self.executor_thread.start()
+        self.executor = WineExecutor(exe_path, args, self.config, self)
+        self.executor.output_ready.connect(self.on_output_ready)
+        self.executor.error_ready.connect(self.on_error_ready)
+        self.executor.process_started.connect(self.on_process_started)
+        self.executor.process_finished.connect(self.on_executor_finished)
+        self.executor.process_finished.connect(self.executor.deleteLater)
+        self.executor.start()
     
     def on_output_ready(self, text: str):
         """Handle process output"""
@@ -537,18 +768,12 @@ class WineApplicationWindow(QMainWindow):
         self.log_tab.append_log(f"Process exited with code: {exit_code}", "#FF9800")
         self.statusBar().showMessage("Ready")
     
-    def on_process_update(self, info: dict):
-        """Handle process update"""
-        pass
-    
     def on_process_finished(self, pid: int, exit_code: int):
         """Handle process finished"""
         self.log_tab.append_log(f"Process {pid} finished with code {exit_code}", "#888")
     
     def run_executable_dialog(self):
         """Show run executable dialog"""
-        from PyQt6.QtWidgets import QFileDialog
-        
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select Executable", "", "Windows Executables (*.exe *.msi);;All Files (*)"
         )
@@ -563,15 +788,7 @@ class WineApplicationWindow(QMainWindow):
     
     def run_wine_tool(self, tool: str):
         """Run Wine tool"""
-        import subprocess
-        
-        env = os.environ.copy()
-        env['WINEPREFIX'] = self.config.config['wine_prefix']
-        
-        try:
-            subprocess.Popen([tool], env=env)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to run {tool}: {str(e)}")
+        _spawn(self, self.config, (tool,))
     
     def show_about(self):
         """Show about dialog"""
@@ -588,54 +805,10 @@ class WineApplicationWindow(QMainWindow):
             "Built with PyQt6 and C++"
         )
     
-    def apply_theme(self):
-        """Apply application theme"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QTabWidget::pane {
-                border: 1px solid #ddd;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                border-bottom: 2px solid #2196F3;
-            }
-            QPushButton {
-                padding: 6px 12px;
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-            QPushButton:pressed {
-                background-color: #0D47A1;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
-    
     def closeEvent(self, event):
         """Handle window close event"""
+        self.config.flush_shortcuts()
+        self.tools_tab.stop_threads()
         self.process_monitor.stop()
         self.process_monitor.wait()
         event.accept()
@@ -645,6 +818,7 @@ def main():
     """Main entry point"""
     app = QApplication(sys.argv)
     app.setApplicationName("Wine Application Manager")
+    app.setStyleSheet(_MAIN_QSS)
     
     window = WineApplicationWindow()
     window.show()